@@ -447,17 +447,13 @@ def print_summary(gwy: Gateway, **kwargs):
 
     if kwargs.get("show_crazys"):
         for device in [d for d in gwy.devices if d.type == DEV_TYPE_MAP.CTL]:
-            for code, verbs in device._msgz.items():
+            for (code, _, _), pkt in device._msgz.items():
                 if code in (Code._0005, Code._000C):
-                    for verb in verbs.values():
-                        for pkt in verb.values():
-                            print(f"{pkt}")
+                    print(f"{pkt}")
             print()
         for device in [d for d in gwy.devices if d.type == DEV_TYPE_MAP.UFC]:
-            for code in device._msgz.values():
-                for verb in code.values():
-                    for pkt in verb.values():
-                        print(f"{pkt}")
+            for pkt in device._msgz.values():
+                print(f"{pkt}")
             print()
 
 
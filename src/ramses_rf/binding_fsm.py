@@ -105,6 +105,7 @@ class BindContextBase:
         self._dev = dev
         self._loop = asyncio.get_running_loop()
         self._fut: None | asyncio.Future = None
+        self._state_event = asyncio.Event()  # set on every transition (e.g. for tests)
 
         self.set_state(DevIsNotBinding)
 
@@ -132,14 +133,19 @@ class BindContextBase:
         self._state = state(self)
         if not self.is_binding:
             self._is_respondent = None
-        elif state is RespIsWaitingForOffer:
-            self._is_respondent = True
-        elif state is SuppSendOfferWaitForAccept:
-            self._is_respondent = False
+            self._dev._gwy._binding_fakeables.discard(self._dev)
+        else:
+            self._dev._gwy._binding_fakeables.add(self._dev)
+            if state is RespIsWaitingForOffer:
+                self._is_respondent = True
+            elif state is SuppSendOfferWaitForAccept:
+                self._is_respondent = False
 
         if _DEBUG_MAINTAIN_STATE_CHAIN:  # HACK for debugging
             setattr(self._state, "_prev_state", prev_state)  # noqa: B010
 
+        self._state_event.set()  # wake any waiters (they check state, then clear)
+
     @property
     def state(self) -> BindStateBase:
         """Return the State (phase) of the Context."""
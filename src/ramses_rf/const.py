@@ -82,6 +82,7 @@ from ramses_tx.const import (  # noqa: F401
     SZ_ZONES,
     ZON_MODE_MAP,
     SystemType,
+    domain_type,
 )
 
 from ramses_tx import (  # noqa: F401, isort: skip, pylint: disable=unused-import
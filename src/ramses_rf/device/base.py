@@ -188,7 +188,7 @@ class DeviceBase(Entity):
     def has_battery(self) -> None | bool:  # 1060
         """Return True if a device is battery powered (excludes battery-backup)."""
 
-        return isinstance(self, BatteryState) or Code._1060 in self._msgz
+        return isinstance(self, BatteryState) or Code._1060 in self._msgz_by_code
 
     @property
     def is_faked(self) -> bool:  # TODO: impersonated vs virtual
@@ -30,7 +30,6 @@ from .. import exceptions as exc
 from ..const import (
     DEV_ROLE_MAP,
     DEV_TYPE_MAP,
-    DOMAIN_TYPE_MAP,
     SZ_DEVICES,
     SZ_DOMAIN_ID,
     SZ_HEAT_DEMAND,
@@ -47,6 +46,7 @@ from ..const import (
     SZ_ZONE_TYPE,
     ZON_ROLE_MAP,
     DevType,
+    domain_type,
 )
 from ..entity_base import Entity, Parent, class_by_attr
 from ..helpers import shrink
@@ -737,8 +737,6 @@ class OtbGateway(Actuator, HeatDemand):  # OTB (10): 3220 (22D9, others)
 
         self._child_id = FC  # NOTE: domain_id
 
-        self._msgz[str(Code._3220)] = {RP: {}}  # self._msgz[Code._3220][RP][msg_id]
-
         # lf._use_ot = self._gwy.config.use_native_ot
         self._msgs_ot: dict[str, Message] = {}
         # lf._msgs_ot_ctl_polled = {}
@@ -1358,8 +1356,8 @@ class BdrSwitch(Actuator, RelayDemand):  # BDR (13):
         """Return the role of the BDR91A (there are six possibilities)."""
 
         # TODO: use self._parent?
-        if self._child_id in DOMAIN_TYPE_MAP:
-            return DOMAIN_TYPE_MAP[self._child_id]
+        if (domain := domain_type(self._child_id)) is not None:
+            return domain
         elif self._parent:
             return self._parent.heating_type  # TODO: only applies to zones
 
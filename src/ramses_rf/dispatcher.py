@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 
 from ramses_tx import (
     CODES_BY_DEV_SLUG,
+    Address,
     Message,
 )
 from ramses_tx.ramses import (
@@ -58,6 +59,11 @@ DEV_MODE = False  # set True for useful Tracebacks
 _DEBUG_FORCE_LOG_MESSAGES = False  # useful for dev/test
 STRICT_MODE = False
 
+# the slug checks log at INFO (WARNING if DEV_MODE): bind the method/level once, and
+# guard each site with isEnabledFor() so msg.__repr__ is never built just to be dropped
+_WARN_OR_INFO = _LOGGER.warning if DEV_MODE else _LOGGER.info
+_CHECK_LOG_LEVEL = logging.WARNING if DEV_MODE else logging.INFO
+
 __all__ = ["detect_array_fragment", "process_msg"]
 
 
@@ -65,13 +71,56 @@ MSG_FORMAT_18 = "|| {:18s} | {:18s} | {:2s} | {:16s} | {:^4s} || {}"
 
 _TD_SECONDS_003 = td(seconds=3)
 
+# Accept tables for the _check_*_slug() validators, built once at import so that the
+# hot path is a single frozenset probe (and not chained dict lookups + f-strings)
+_SRC_OK: frozenset[tuple[str, str, str]] = frozenset(
+    (slug, verb, code)
+    for slug, codes in CODES_BY_DEV_SLUG.items()
+    for code, verbs in codes.items()
+    for verb in verbs
+)
+_INVERSE_VERB = {RQ: RP, RP: RQ, W_: I_}  # the Tx verb implied by a dst's Rx verb
+_DST_OK: frozenset[tuple[str, str, str]] = frozenset(
+    (slug, verb, code)
+    for slug, codes in CODES_BY_DEV_SLUG.items()
+    for code, verbs in codes.items()
+    for verb, rx_verb in _INVERSE_VERB.items()
+    if rx_verb in verbs
+)
+_DST_HACK: frozenset[tuple[str, str, str]] = frozenset(
+    {(DevType.CTL, RQ, Code._3EF1), (DevType.BDR, RQ, Code._3EF0)}
+    | {(slug, W_, Code._0001) for slug in CODES_BY_DEV_SLUG}
+)  # exceptions-to-the-rule that need sorting
+_DST_ANY: frozenset[tuple[str, str, str]] = _DST_OK | _DST_HACK
+
+# slugs that are exempt from validation (TODO: use DEV_TYPE_MAP.PROMOTABLE_SLUGS)
+_PROMOTABLE_SRC = frozenset({DevType.HGI, DevType.DEV, DevType.HEA, DevType.HVC})
+_PROMOTABLE_DST = frozenset({None, DevType.HGI, DevType.DEV, DevType.HEA, DevType.HVC})
+
+
+def _log_msg(gwy: Gateway, msg: Message) -> None:
+    """Log the processed message (a nested def would be rebuilt every packet)."""
+    is_hgi = msg.src is gwy.hgi
+    if _DEBUG_FORCE_LOG_MESSAGES:
+        _LOGGER.warning(msg)
+    elif not is_hgi or (msg.code != Code._PUZZ and msg.verb != RQ):
+        _LOGGER.info(msg)
+    elif not is_hgi or msg.verb != RQ:
+        _LOGGER.info(msg)
+    elif _LOGGER.getEffectiveLevel() == logging.DEBUG:
+        _LOGGER.info(msg)
+
+
+def _dispatch_many(handlers: tuple, msg: Message) -> None:
+    """Invoke several _handle_msg callbacks from a single scheduled callback."""
+    for handler in handlers:
+        handler(msg)
+
 
 def _create_devices_from_addrs(gwy: Gateway, this: Message) -> None:
     """Discover and create any new devices using the packet addresses (not payload)."""
 
     # prefer Devices but can continue with Addresses if required...
-    this.src = gwy.device_by_id.get(this.src.id, this.src)
-    this.dst = gwy.device_by_id.get(this.dst.id, this.dst)
 
     # Devices need to know their controller, ?and their location ('parent' domain)
     # NB: only addrs processed here, packet metadata is processed elsewhere
@@ -87,23 +136,35 @@ def _create_devices_from_addrs(gwy: Gateway, this: Message) -> None:
     #  - discovery: from packet fingerprint, excl. payloads (only for 10:)
     #  - eavesdrop: from packet fingerprint, incl. payloads
 
-    if not isinstance(this.src, Device):
-        this.src = gwy.get_device(this.src.id)  # may: LookupError (don't swallow)
-        if this.dst.id == this.src.id:
-            this.dst = this.src
-            return
+    dst_id = this.dst.id
+
+    src_dev = gwy.device_by_id.get(this.src.id)
+    if src_dev is None:
+        src_dev = gwy.get_device(this.src.id)  # may: LookupError (don't swallow)
+    this.src = src_dev
+
+    if dst_id == src_dev.id:  # the common case: src is dst (e.g. broadcasts)
+        this.dst = src_dev
+        return
+
+    dst_dev = gwy.device_by_id.get(dst_id)
+    if dst_dev is not None:
+        this.dst = dst_dev
+        return  # already a known Device: nothing left for eavesdropping to do
 
     if not gwy.config.enable_eavesdrop:
         return
 
-    if not isinstance(this.dst, Device) and this.src is not gwy.hgi:
+    if src_dev is not gwy.hgi:
         try:
-            this.dst = gwy.get_device(this.dst.id)  # may: LookupError (but swallow it)
+            this.dst = gwy.get_device(dst_id)  # may: LookupError (but swallow it)
         except LookupError:
             pass
 
 
-def _check_msg_addrs(msg: Message) -> None:  # TODO
+def _check_msg_addrs(
+    msg: Message, src: Address | Device, dst: Address | Device, code: Code
+) -> None:  # TODO
     """Validate the packet's address set.
 
     Raise InvalidAddrSetError if the meta data is invalid, otherwise simply return.
@@ -112,130 +173,156 @@ def _check_msg_addrs(msg: Message) -> None:  # TODO
     # TODO: needs work: doesn't take into account device's (non-HVAC) class
 
     if (
-        msg.src.id != msg.dst.id
-        and msg.src.type == msg.dst.type
-        and msg.src.type in DEV_TYPE_MAP.HEAT_DEVICES  # could still be HVAC domain
+        src.id != dst.id
+        and src.type == dst.type
+        and src.type in DEV_TYPE_MAP.HEAT_DEVICES  # could still be HVAC domain
     ):
         # .I --- 18:013393 18:000730 --:------ 0001 005 00FFFF0200     # invalid
         # .I --- 01:078710 --:------ 01:144246 1F09 003 FF04B5         # invalid
         # .I --- 29:151550 29:237552 --:------ 22F3 007 00023C03040000 # valid? HVAC
-        if msg.code in CODES_OF_HEAT_DOMAIN_ONLY:
-            raise exc.PacketAddrSetInvalid(
-                f"Invalid addr pair: {msg.src!r}/{msg.dst!r}"
-            )
-        elif msg.code in CODES_OF_HEAT_DOMAIN:
-            _LOGGER.warning(
-                f"{msg!r} < Invalid addr pair: {msg.src!r}/{msg.dst!r}, is it HVAC?"
-            )
-        elif msg.code not in CODES_OF_HVAC_DOMAIN_ONLY:
-            _LOGGER.info(
-                f"{msg!r} < Invalid addr pair: {msg.src!r}/{msg.dst!r}, is it HVAC?"
-            )
+        if code in CODES_OF_HEAT_DOMAIN_ONLY:
+            raise exc.PacketAddrSetInvalid(f"Invalid addr pair: {src!r}/{dst!r}")
+        elif code in CODES_OF_HEAT_DOMAIN:
+            _LOGGER.warning(f"{msg!r} < Invalid addr pair: {src!r}/{dst!r}, is it HVAC?")
+        elif code not in CODES_OF_HVAC_DOMAIN_ONLY:
+            _LOGGER.info(f"{msg!r} < Invalid addr pair: {src!r}/{dst!r}, is it HVAC?")
 
 
-def _check_src_slug(msg: Message, *, slug: str = None) -> None:
+def _check_msg_slugs(
+    msg: Message, src: Address | Device, dst: Address | Device, code: Code, verb: Verb
+) -> None:
+    """Validate both device classes against the verb/code pair (table-driven).
+
+    The accept tables answer the common (valid) case with one probe each; only
+    packets that miss fall through to the per-case diagnostics in _check_*_slug.
+
+    Raise InvalidPacketError if the meta data is invalid, otherwise simply return.
+    """
+
+    src_slug = getattr(src, "_SLUG", DevType.DEV)
+    if src_slug not in _PROMOTABLE_SRC and (src_slug, verb, code) not in _SRC_OK:
+        _check_src_slug(msg, src, code, verb, slug=src_slug)  # ? InvalidPacketError
+
+    if verb == I_:  # receiving an I isn't in the schema (the check is a no-op)
+        return
+
+    dst_slug = getattr(dst, "_SLUG", None)
+    if dst_slug not in _PROMOTABLE_DST and (dst_slug, verb, code) not in _DST_ANY:
+        _check_dst_slug(msg, src, dst, code, verb, slug=dst_slug)  # ? InvalidPacketError
+
+
+def _check_src_slug(
+    msg: Message, src: Address | Device, code: Code, verb: Verb, *, slug: str = None
+) -> None:
     """Validate the packet's source device class (type) against its verb/code pair.
 
     Raise InvalidPacketError if the meta data is invalid, otherwise simply return.
     """
 
-    if slug is None:  # slug = best_dev_role(msg.src, msg=msg)._SLUG
-        slug = getattr(msg.src, "_SLUG", DevType.DEV)
+    if slug is None:  # slug = best_dev_role(src, msg=msg)._SLUG
+        slug = getattr(src, "_SLUG", DevType.DEV)
     if slug in (DevType.HGI, DevType.DEV, DevType.HEA, DevType.HVC):
         return  # TODO: use DEV_TYPE_MAP.PROMOTABLE_SLUGS
 
+    if (slug, verb, code) in _SRC_OK:
+        return
+
     if slug not in CODES_BY_DEV_SLUG:
-        if msg.code != Code._10E0 and msg.code not in CODES_OF_HVAC_DOMAIN_ONLY:
+        if code != Code._10E0 and code not in CODES_OF_HVAC_DOMAIN_ONLY:
             err_msg = f"Unknown src type: {msg.dst}"
             if STRICT_MODE:
                 raise exc.PacketInvalid(err_msg)
-            (_LOGGER.warning if DEV_MODE else _LOGGER.info)(f"{msg!r} < {err_msg}")
+            if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+                _WARN_OR_INFO("%r < %s", msg, err_msg)
             return
-        _LOGGER.warning(f"{msg!r} < Unknown src type: {msg.src}, is it HVAC?")
+        _LOGGER.warning(f"{msg!r} < Unknown src type: {src}, is it HVAC?")
         return
 
     #
     #
 
-    if msg.code not in CODES_BY_DEV_SLUG[slug]:  # type: ignore[index]
+    if code not in CODES_BY_DEV_SLUG[slug]:  # type: ignore[index]
         if slug != DevType.DEV:
-            err_msg = f"Invalid code for {msg.src} to Tx: {msg.code}"
+            err_msg = f"Invalid code for {src} to Tx: {code}"
             if STRICT_MODE:
                 raise exc.PacketInvalid(err_msg)
-            (_LOGGER.warning if DEV_MODE else _LOGGER.info)(f"{msg!r} < {err_msg}")
+            if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+                _WARN_OR_INFO("%r < %s", msg, err_msg)
             return
-        if msg.verb in (RQ, W_):
+        if verb in (RQ, W_):
             return
-        (_LOGGER.warning if DEV_MODE else _LOGGER.info)(
-            f"{msg!r} < Invalid code for {msg.src} to Tx: {msg.code}"
-        )
+        if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+            _WARN_OR_INFO("%r < Invalid code for %s to Tx: %s", msg, src, code)
         return
 
     #
     #
 
-    #
-    # (code := CODES_BY_DEV_SLUG[slug][msg.code]) and msg.verb not in code:
-    if msg.verb not in CODES_BY_DEV_SLUG[slug][msg.code]:  # type: ignore[index]
-        err_msg = f"Invalid verb/code for {msg.src} to Tx: {msg.verb}/{msg.code}"
-        if STRICT_MODE:
-            raise exc.PacketInvalid(err_msg)
-        (_LOGGER.warning if DEV_MODE else _LOGGER.info)(f"{msg!r} < {err_msg}")
-
-
-def _check_dst_slug(msg: Message, *, slug: str = None) -> None:
+    # (slug, verb, code) not in _SRC_OK, but slug/code are known: the verb is invalid
+    err_msg = f"Invalid verb/code for {src} to Tx: {verb}/{code}"
+    if STRICT_MODE:
+        raise exc.PacketInvalid(err_msg)
+    if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+        _WARN_OR_INFO("%r < %s", msg, err_msg)
+
+
+def _check_dst_slug(
+    msg: Message,
+    src: Address | Device,
+    dst: Address | Device,
+    code: Code,
+    verb: Verb,
+    *,
+    slug: str = None,
+) -> None:
     """Validate the packet's destination device class (type) against its verb/code pair.
 
     Raise InvalidPacketError if the meta data is invalid, otherwise simply return.
     """
 
+    if verb == I_:  # TODO: not common, unless src=dst - the majority of RF traffic
+        return  # receiving an I isn't currently in the schema & cant yet be tested
+
     if slug is None:
-        slug = getattr(msg.dst, "_SLUG", None)
+        slug = getattr(dst, "_SLUG", None)
     if slug in (None, DevType.HGI, DevType.DEV, DevType.HEA, DevType.HVC):
         return  # TODO: use DEV_TYPE_MAP.PROMOTABLE_SLUGS
 
+    if (slug, verb, code) in _DST_ANY:
+        return
+
     if slug not in CODES_BY_DEV_SLUG:
-        if msg.code not in CODES_OF_HVAC_DOMAIN_ONLY:
-            err_msg = f"Unknown dst type: {msg.dst}"
+        if code not in CODES_OF_HVAC_DOMAIN_ONLY:
+            err_msg = f"Unknown dst type: {dst}"
             if STRICT_MODE:
                 raise exc.PacketInvalid(err_msg)
-            (_LOGGER.warning if DEV_MODE else _LOGGER.info)(f"{msg!r} < {err_msg}")
+            if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+                _WARN_OR_INFO("%r < %s", msg, err_msg)
             return
-        _LOGGER.warning(f"{msg!r} < Unknown dst type: {msg.dst}, is it HVAC?")
+        _LOGGER.warning(f"{msg!r} < Unknown dst type: {dst}, is it HVAC?")
         return
 
-    if msg.verb == I_:  # TODO: not common, unless src=dst
-        return  # receiving an I isn't currently in the schema & cant yet be tested
-    if f"{slug}/{msg.verb}/{msg.code}" in (f"CTL/{RQ}/{Code._3EF1}",):
-        return  # HACK: an exception-to-the-rule that need sorting
-
-    if msg.code not in CODES_BY_DEV_SLUG[slug]:  # type: ignore[index]
+    if code not in CODES_BY_DEV_SLUG[slug]:  # type: ignore[index]
         if False and slug != DevType.HGI:  # NOTE: not yet needed because of 1st if
-            err_msg = f"Invalid code for {msg.dst} to Rx: {msg.code}"
+            err_msg = f"Invalid code for {dst} to Rx: {code}"
             if STRICT_MODE:
                 raise exc.PacketInvalid(err_msg)
-            (_LOGGER.warning if DEV_MODE else _LOGGER.info)(f"{msg!r} < {err_msg}")
+            if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+                _WARN_OR_INFO("%r < %s", msg, err_msg)
             return
-        if msg.src._SLUG == DevType.HGI or msg.verb == RP:
+        if src._SLUG == DevType.HGI or verb == RP:
             # HGI can do what it like
             return
-        (_LOGGER.warning if DEV_MODE else _LOGGER.info)(
-            f"{msg!r} < Invalid code for {msg.dst} to Rx/Tx: {msg.code}"
-        )
+        if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+            _WARN_OR_INFO("%r < Invalid code for %s to Rx/Tx: %s", msg, dst, code)
         return
 
-    if f"{msg.verb}/{msg.code}" in (f"{W_}/{Code._0001}",):
-        return  # HACK: an exception-to-the-rule that need sorting
-    if f"{slug}/{msg.verb}/{msg.code}" in (f"{DevType.BDR}/{RQ}/{Code._3EF0}",):
-        return  # HACK: an exception-to-the-rule that need sorting
-
-    verb = {RQ: RP, RP: RQ, W_: I_}[msg.verb]
-    # (code := CODES_BY_DEV_SLUG[klass][msg.code]) and verb not in code:
-    if verb not in CODES_BY_DEV_SLUG[slug][msg.code]:  # type: ignore[index]
-        err_msg = f"Invalid verb/code for {msg.dst} to Rx: {msg.verb}/{msg.code}"
-        if STRICT_MODE:
-            raise exc.PacketInvalid(err_msg)
-        (_LOGGER.warning if DEV_MODE else _LOGGER.info)(f"{msg!r} < {err_msg}")
+    # (slug, verb, code) not in _DST_OK (or _DST_HACK): the verb/code is invalid
+    err_msg = f"Invalid verb/code for {dst} to Rx: {verb}/{code}"
+    if STRICT_MODE:
+        raise exc.PacketInvalid(err_msg)
+    if _LOGGER.isEnabledFor(_CHECK_LOG_LEVEL):
+        _WARN_OR_INFO("%r < %s", msg, err_msg)
 
 
 def process_msg(gwy: Gateway, msg: Message) -> None:
@@ -244,22 +331,16 @@ def process_msg(gwy: Gateway, msg: Message) -> None:
     # All methods require msg with a valid payload, except _create_devices_from_addrs(),
     # which requires a valid payload only for 000C.
 
-    def logger_xxxx(msg: Message):
-        if _DEBUG_FORCE_LOG_MESSAGES:
-            _LOGGER.warning(msg)
-        elif msg.src is not gwy.hgi or (msg.code != Code._PUZZ and msg.verb != RQ):
-            _LOGGER.info(msg)
-        elif msg.src is not gwy.hgi or msg.verb != RQ:
-            _LOGGER.info(msg)
-        elif _LOGGER.getEffectiveLevel() == logging.DEBUG:
-            _LOGGER.info(msg)
+    # bind the hot attributes to locals, once (attr access is slower than LOAD_FAST)
+    src, dst, code, verb = msg.src, msg.dst, msg.code, msg.verb
+    call_soon = gwy._loop.call_soon
 
     try:  # validate / dispatch the packet
-        _check_msg_addrs(msg)  # ?InvalidAddrSetError  TODO: ?useful at all
+        _check_msg_addrs(msg, src, dst, code)  # ?InvalidAddrSetError  TODO: ?useful at all
 
         # TODO: any use in creating a device only if the payload is valid?
         if gwy.config.reduce_processing >= DONT_CREATE_ENTITIES:
-            logger_xxxx(msg)  # return ensures try's else: clause wont be invoked
+            _log_msg(gwy, msg)  # return ensures try's else: clause wont be invoked
             return
 
         try:
@@ -269,46 +350,44 @@ def process_msg(gwy: Gateway, msg: Message) -> None:
                 "%s < %s(%s)", msg._pkt, err.__class__.__name__, err
             )
             return
+        src, dst = msg.src, msg.dst  # may have been promoted from Address to Device
 
-        _check_src_slug(msg)  # ? InvalidPacketError
-        if msg.dst is not msg.src or msg.verb != I_:
-            _check_dst_slug(msg)  # ? InvalidPacketError
+        _check_msg_slugs(msg, src, dst, code, verb)  # ? InvalidPacketError
 
         if gwy.config.reduce_processing >= DONT_UPDATE_ENTITIES:
-            logger_xxxx(msg)  # return ensures try's else: clause wont be invoked
+            _log_msg(gwy, msg)  # return ensures try's else: clause wont be invoked
             return
 
         # NOTE: here, msgs are routed only to devices: routing to other entities (i.e.
         # systems, zones, circuits) is done by those devices (e.g. UFC to UfhCircuit)
 
-        if isinstance(msg.src, Device):  # , HgiGateway)):  # could use DeviceBase
-            gwy._loop.call_soon(msg.src._handle_msg, msg)
+        # src is always a Device here: _create_devices_from_addrs() either resolved
+        # it or raised LookupError (so no isinstance on the steady-state path)
+        call_soon(src._handle_msg, msg)
 
         # TODO: should only be for fully-faked dst (as it will pick up via RF if not)
-        if msg.dst is not msg.src and isinstance(msg.dst, Fakeable):
-            devices = [msg.dst]  # dont: msg.dst._handle_msg(msg)
-
-        elif msg.code == Code._1FC9 and msg.payload[SZ_PHASE] == SZ_OFFER:
-            devices = [
-                d
-                for d in gwy.devices
-                if d is not msg.src
-                and isinstance(d, Fakeable)
-                and d._context.is_binding
-            ]
-
-        elif hasattr(msg.src, SZ_DEVICES):
+        if dst is not src and isinstance(dst, Fakeable):
+            devices = [dst]  # dont: dst._handle_msg(msg)
+
+        elif code == Code._1FC9 and msg.payload[SZ_PHASE] == SZ_OFFER:
+            # the binding-index is maintained by BindContextBase.set_state()
+            devices = [d for d in gwy._binding_fakeables if d is not src]
+
+        elif (devs := getattr(src, SZ_DEVICES, None)) is not None:
             # .I --- 22:060293 --:------ 22:060293 0008 002 000C
             # .I --- 01:054173 --:------ 01:054173 0008 002 03AA
             # needed for (e.g.) faked relays: each device decides if the pkt is useful
-            devices = msg.src.devices  # if d._SLUG = "BDR"
+            devices = devs  # if d._SLUG = "BDR"
 
         else:
             devices = []
 
-        for d in devices:  # FIXME: some may be Addresses?
-            # if True or getattr(d, "_faked", False):
-            gwy._loop.call_soon(d._handle_msg, msg)
+        # FIXME: some may be Addresses?
+        # if True or getattr(d, "_faked", False):
+        if len(devices) > 1:  # schedule once: a Handle per call_soon adds up
+            call_soon(_dispatch_many, tuple(d._handle_msg for d in devices), msg)
+        elif devices:
+            call_soon(devices[0]._handle_msg, msg)
 
     except (AssertionError, exc.RamsesException, NotImplementedError) as err:
         (_LOGGER.error if DEV_MODE else _LOGGER.warning)(
@@ -319,22 +398,27 @@ def process_msg(gwy: Gateway, msg: Message) -> None:
         _LOGGER.exception("%s < %s(%s)", msg._pkt, err.__class__.__name__, err)
 
     else:
-        logger_xxxx(msg)
+        _log_msg(gwy, msg)
 
 
 # TODO: this needs cleaning up (e.g. handle intervening packet)
-def detect_array_fragment(this: Message, prev: Message) -> dict:  # _PayloadT
-    """Return a merged array if this pkt is the latter half of an array."""
+def detect_array_fragment(this: Message, prev: Message) -> bool:
+    """Return True if this pkt is the latter half of an array."""
     # This will work, even if the 2nd pkt._is_array == False as 1st == True
     # .I --- 01:158182 --:------ 01:158182 000A 048 001201F409C4011101F409C40...
     # .I --- 01:158182 --:------ 01:158182 000A 006 081001F409C4
 
-    return (
-        prev
-        and prev._has_array
-        and this.code in (Code._000A, Code._22C9)  # TODO: not a complete list
-        and this.code == prev.code
-        and this.verb == prev.verb == I_
-        and this.src == prev.src
-        and this.dtm < prev.dtm + _TD_SECONDS_003
-    )
+    # ordered cheapest/most-selective first: nearly all packets fail the verb/code
+    # tests, so the cross-checks against prev are rarely evaluated
+    if this.verb is not I_:
+        return False
+    code = this.code
+    if code is not Code._000A and code is not Code._22C9:  # TODO: not a complete list
+        return False
+    if prev is None or not prev._has_array:
+        return False
+    if code != prev.code or prev.verb is not I_:
+        return False
+    if this.src != prev.src:
+        return False
+    return this.dtm < prev.dtm + _TD_SECONDS_003
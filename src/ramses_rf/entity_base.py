@@ -87,6 +87,10 @@ class _Entity:
 
     This class is mainly concerned with:
      - if the entity can Rx packets (e.g. can the HGI send it an RQ)
+
+    NOTE: no __slots__ here (nor in subclasses): devices are promoted at runtime by
+    reassigning self.__class__ (see DeviceBase), which needs compatible (i.e. dict-
+    based) instance layouts across the sibling classes.
     """
 
     _SLUG: str = None  # type: ignore[assignment]
@@ -170,24 +174,27 @@ class _MessageDB(_Entity):
         super().__init__(gwy)
 
         self._msgs: dict[Code, Message] = {}  # code, should be code/ctx? ?deprecate
-        self._msgz: dict[Code, Any] = {}  # code/verb/ctx, should be code/ctx/verb?
+        self._msgz: dict[tuple, Message] = {}  # keyed by (code, verb, ctx)
+        # a per-code view of _msgz (keyed by (verb, ctx)): the flat keys made
+        # "all msgs for a code/verb" a full scan, so keep this index alongside
+        self._msgz_by_code: dict[Code, dict[tuple, Message]] = {}
+
+        self._msgz_ver: int = 0  # bumped on every write/delete, invalidates the cache
+        self._msg_db_cache: tuple[list | None, int] = (None, -1)
 
     def _handle_msg(self, msg: Message) -> None:  # TODO: beware, this is a mess
-        """Store a msg in _msgs[code] (only latest I/RP) and _msgz[code][verb][ctx]."""
+        """Store a msg in _msgs[code] (only latest I/RP) and _msgz[code, verb, ctx]."""
 
         if msg.verb in (I_, RP):
             self._msgs[msg.code] = msg
 
-        if msg.code not in self._msgz:
-            self._msgz[msg.code] = {msg.verb: {msg._pkt._ctx: msg}}
-        elif msg.verb not in self._msgz[msg.code]:
-            self._msgz[msg.code][msg.verb] = {msg._pkt._ctx: msg}
-        else:
-            self._msgz[msg.code][msg.verb][msg._pkt._ctx] = msg
+        self._msgz[(msg.code, msg.verb, msg._ctx)] = msg
+        self._msgz_by_code.setdefault(msg.code, {})[(msg.verb, msg._ctx)] = msg
+        self._msgz_ver += 1
 
     @property
-    def _msg_db(self) -> list:  # a flattened version of _msgz[code][verb][indx]
-        """Return a flattened version of _msgz[code][verb][index].
+    def _msg_db(self) -> list:  # a flattened version of _msgz
+        """Return a flattened version of _msgz[code, verb, index].
 
         The idx is one of:
          - a simple index (e.g. zone_idx, domain_id, aka child_id)
@@ -196,28 +203,29 @@ class _MessageDB(_Entity):
          - False (no idx, is usu. 00),
          - None (not deteminable, rare)
         """
-        return [m for c in self._msgz.values() for v in c.values() for m in v.values()]
+        msgs, ver = self._msg_db_cache
+        if msgs is None or ver != self._msgz_ver:
+            msgs = list(self._msgz.values())
+            self._msg_db_cache = (msgs, self._msgz_ver)
+        return msgs
 
     def _get_msg_by_hdr(self, hdr: _HeaderT) -> Message | None:
         """Return a msg, if any, that matches a header."""
 
-        msg: Message
+        msg: Message | None
 
         code, verb, _, *args = hdr.split("|")  # _ is device_id
 
-        try:
-            if args and (ctx := args[0]):  # ctx may == True
-                msg = self._msgz[code][verb][ctx]
-            elif False in self._msgz[code][verb]:
-                msg = self._msgz[code][verb][False]
-            elif None in self._msgz[code][verb]:
-                msg = self._msgz[code][verb][None]
-            else:
-                return None
-        except KeyError:
+        if args and (ctx := args[0]):  # ctx may == True
+            msg = self._msgz.get((code, verb, ctx))
+        else:
+            msg = self._msgz.get((code, verb, False)) or self._msgz.get(
+                (code, verb, None)
+            )
+        if msg is None:
             return None
 
-        if msg._pkt._hdr != hdr:
+        if msg._hdr != hdr:
             raise LookupError
 
         return msg
@@ -245,12 +253,9 @@ class _MessageDB(_Entity):
         ), f"Unsupported: using a tuple ({code}) with a verb ({verb})"
 
         if verb:
-            try:
-                msgs = self._msgz[code][verb]
-            except KeyError:
-                msg = None
-            else:
-                msg = max(msgs.values()) if msgs else None
+            by_code = self._msgz_by_code.get(code, {})
+            msgs = [m for (v, _), m in by_code.items() if v == verb]
+            msg = max(msgs) if msgs else None
         elif isinstance(code, tuple):
             msgs = [m for m in self._msgs.values() if m.code in code]
             msg = max(msgs) if msgs else None
@@ -299,6 +304,8 @@ class _MessageDB(_Entity):
 
         if key:
             return msg_dict.get(key)
+        if msg_dict is msg.payload:  # the common case: the filtered dict is cached
+            return msg._public_payload
         return {
             k: v
             for k, v in msg_dict.items()
@@ -349,8 +356,8 @@ class _Discovery(_MessageDB):
         """Return the current list of pollable command codes."""
         return {
             code: (CODES_SCHEMA[code][SZ_NAME] if code in CODES_SCHEMA else None)
-            for code in sorted(self._msgz)
-            if self._msgz[code].get(RP) and self.is_pollable_cmd(code)
+            for code in sorted({c for c, v, _ in self._msgz if v == RP})
+            if self.is_pollable_cmd(code)
         }
 
     @property
@@ -358,7 +365,9 @@ class _Discovery(_MessageDB):
         """Return the current list of pollable OT msg_ids."""
         return {
             msg_id: OPENTHERM_MESSAGES[int(msg_id, 16)].get("var")
-            for msg_id in sorted(self._msgz[Code._3220].get(RP, []))
+            for msg_id in sorted(
+                ctx for c, v, ctx in self._msgz if c == Code._3220 and v == RP
+            )
             if self.is_pollable_cmd(Code._3220, ctx=msg_id)
         }
 
@@ -452,7 +461,7 @@ class _Discovery(_MessageDB):
 
             try:
                 if task[_SZ_COMMAND].code in (Code._000A, Code._30C9):
-                    msgs += [self.tcs._msgz[task[_SZ_COMMAND].code][I_][True]]
+                    msgs += [self.tcs._msgz[(task[_SZ_COMMAND].code, I_, True)]]
             except KeyError:
                 pass
 
@@ -579,14 +588,18 @@ def _delete_msg(msg: Message) -> None:
             entities.append(msg.src.tcs.dhw)
         entities.extend(msg.src.tcs.zones)
 
+    code, verb, ctx = msg.code, msg.verb, msg._ctx
+
     # remove the msg from all the state DBs
     for obj in entities:
-        if msg in obj._msgs.values():
-            del obj._msgs[msg.code]
-        try:
-            del obj._msgz[msg.code][msg.verb][msg._pkt._ctx]
-        except KeyError:
-            pass
+        if obj._msgs.get(code) == msg:
+            del obj._msgs[code]
+        if obj._msgz.pop((code, verb, ctx), None) is not None:
+            if (by_code := obj._msgz_by_code.get(code)) is not None:
+                by_code.pop((verb, ctx), None)
+                if not by_code:
+                    del obj._msgz_by_code[code]
+            obj._msgz_ver += 1
 
 
 class Parent(Entity):  # A System, Zone, DhwZone or a UfhController
@@ -306,7 +306,7 @@ class Engine:
         self,
         cmd: Command,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         timeout: float = DEFAULT_TIMEOUT,
         wait_for_reply: bool | None = None,
     ) -> Packet | None:
@@ -386,6 +386,10 @@ class Gateway(Engine):
         self.devices: list[Device] = []
         self.device_by_id: dict[str, Device] = {}
 
+        # Fakeable devices with a binding in progress (maintained by BindContextBase),
+        # so that dispatching a 1FC9 doesn't need to scan all of self.devices
+        self._binding_fakeables: set[Device] = set()
+
     def __repr__(self) -> str:
         if not self.ser_name:
             return f"Gateway(input_file={self._input_file})"
@@ -653,9 +657,9 @@ class Gateway(Engine):
     @property
     def system_by_id(self) -> dict:
         return {
-            d.id: d.tcs
+            d.id: tcs
             for d in self.devices
-            if hasattr(d, "tcs") and getattr(d.tcs, "id", None) == d.id
+            if (tcs := getattr(d, "tcs", None)) and getattr(tcs, "id", None) == d.id
         }  # why something so simple look so messy
 
     @property
@@ -787,6 +791,8 @@ class Gateway(Engine):
         # TODO: ideally remove this feature...
         if detect_array_fragment(self._this_msg, self._prev_msg):
             msg._pkt._force_has_array()  # may be an array of length 1
+            msg._ctx, msg._hdr = msg._pkt._ctx, msg._pkt._hdr  # both were reset
+            msg._idx_ = None  # type: ignore[assignment]  # ditto (recompute lazily)
             msg._payload = self._prev_msg.payload + (
                 msg.payload if isinstance(msg.payload, list) else [msg.payload]
             )
@@ -812,7 +818,7 @@ class Gateway(Engine):
         self,
         cmd: Command,
         max_retries: int = DEFAULT_MAX_RETRIES,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         timeout: float = DEFAULT_TIMEOUT,
         wait_for_reply: bool | None = None,
         **kwargs,
@@ -692,9 +692,9 @@ class Zone(ZoneSchedule, ZoneBase):
     def heat_demand(self) -> None | float:  # 3150
         """Return the zone's heat demand, estimated from its devices' heat demand."""
         demands = [
-            d.heat_demand
+            demand
             for d in self.actuators  # TODO: actuators
-            if hasattr(d, SZ_HEAT_DEMAND) and d.heat_demand is not None
+            if (demand := getattr(d, SZ_HEAT_DEMAND, None)) is not None
         ]
         return _transform(max(demands + [0])) if demands else None
 
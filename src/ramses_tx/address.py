@@ -4,6 +4,7 @@
 """RAMSES RF - a RAMSES-II protocol decoder & analyser."""
 from __future__ import annotations
 
+import sys
 from functools import lru_cache
 
 from . import exceptions as exc
@@ -40,8 +41,9 @@ class Address:
         # if device_id is None:
         #     device_id = NON_DEVICE_ID
 
-        self.id = device_id  # TODO: check is a valid id...
-        self.type = device_id[:2]  # dex, NOTE: remove last
+        # interned, so equality checks between ids are pointer compares
+        self.id = device_id = sys.intern(device_id)  # TODO: check is a valid id...
+        self.type = sys.intern(device_id[:2])  # dex, NOTE: remove last
         self._hex_id: str = None  # type: ignore[assignment]
 
         if not self.is_valid(device_id):
@@ -66,11 +68,11 @@ class Address:
         return self._hex_id
 
     @staticmethod
-    def is_valid(value: str) -> bool:  # Union[str, Match[str], None]:
+    def is_valid(value: str) -> bool:
         # if value[:2] not in DEV_TYPE_MAP:
         #     return False
 
-        return isinstance(value, str) and (
+        return isinstance(value, str) and bool(
             value == NON_DEVICE_ID or DEVICE_ID_REGEX.ANY.match(value)
         )
 
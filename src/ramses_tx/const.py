@@ -5,9 +5,12 @@
 from __future__ import annotations
 
 import re
-from enum import EnumCheck, IntEnum, StrEnum, verify
-from types import SimpleNamespace
-from typing import Final, Literal
+import sys
+from collections.abc import Mapping
+from enum import StrEnum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Literal, NamedTuple
 
 __dev_mode__ = False
 DEV_MODE = __dev_mode__
@@ -76,22 +79,47 @@ SZ_SPEED_CAP: Final[str] = "speed_capabilities"
 SZ_PRESENCE_DETECTED: Final[str] = "presence_detected"
 
 
-@verify(EnumCheck.UNIQUE)
-class Priority(IntEnum):
-    LOWEST = 4
-    LOW = 2
-    DEFAULT = 0
-    HIGH = -2
-    HIGHEST = -4
+class Priority:  # not an IntEnum: queue ordering wants bare int compares
+    __slots__ = ()
 
+    LOWEST: Final[int] = 4
+    LOW: Final[int] = 2
+    DEFAULT: Final[int] = 0
+    HIGH: Final[int] = -2
+    HIGHEST: Final[int] = -4
 
+
+# lowercase & replace non-alnums in one pass (the labels slugged here are ASCII)
+_SLUG_TRANS: Final = str.maketrans(
+    {c: c.lower() if c.isalnum() else "_" for c in map(chr, range(128))}
+)
+_SLUG_COLLAPSE_RE: Final = re.compile(r"_+")
+
+
+@lru_cache(maxsize=1024)  # the inputs are a small, bounded set of names
 def slug(string: str) -> str:
     """Convert a string to snake_case."""
-    return re.sub(r"[\W_]+", "_", string.lower())
+    return _SLUG_COLLAPSE_RE.sub("_", string.translate(_SLUG_TRANS))
+
+
+_HEX_CHARS = "0123456789ABCDEF"  # canonical form only: no sign/space/lowercase
 
 
 # TODO: FIXME: This is a mess - needs converting to StrEnum
 class AttrDict(dict):
+    # the bespoke attrs (slugs, etc.) resolve via __getattr__, so the only true
+    # instance attrs are the lookup tables - slot them (no per-instance __dict__)
+    __slots__ = (
+        "_main_table",
+        "_attr_table",
+        "_slug_lookup",
+        "_forward",
+        "_reverse",
+        "_getitem_map",
+        "_getattr_map",
+        "_slug_lookup_arr",
+    )
+
     _SZ_AKA_SLUG: Final[str] = "_root_slug"
     _SZ_DEFAULT: Final[str] = "_default"
     _SZ_SLUGS: Final[str] = "SLUGS"
@@ -115,70 +143,85 @@ class AttrDict(dict):
         self._attr_table = attr_table
         self._attr_table[self._SZ_SLUGS] = tuple(sorted(main_table.keys()))
 
-        self._slug_lookup: dict = {
-            None: slug
-            for slug, table in main_table.items()
-            for k in table.values()
-            if isinstance(k, str) and table.get(self._SZ_DEFAULT)
-        }  # i.e. {None: 'HEA'}
-        self._slug_lookup.update(
-            {
-                k: table.get(self._SZ_AKA_SLUG, slug)
-                for slug, table in main_table.items()
-                for k in table
-                if isinstance(k, str) and len(k) == 2
-            }  # e.g. {'00': 'TRV', '01': 'CTL', '04': 'TRV', ...}
-        )
-        self._slug_lookup.update(
-            {
-                k: slug
-                for slug, table in main_table.items()
-                for k in table.values()
-                if isinstance(k, str) and table.get(self._SZ_AKA_SLUG) is None
-            }  # e.g. {'heat_device':'HEA', 'dhw_sensor':'DHW', ...}
+        # one fused traversal of the main table (rather than five separate passes)
+        slug_lookup: dict[str | None, str] = {}  # i.e. {None: 'HEA'}
+        hex_lookup: dict[str, str] = {}  # e.g. {'00': 'TRV', '04': 'TRV', ...}
+        str_lookup: dict[str, str] = {}  # e.g. {'heat_device': 'HEA', ...}
+        forward: dict[str, str] = {}  # e.g. {'00': 'radiator_valve', ...}
+        reverse: dict[str, str] = {}  # e.g. {'radiator_valve': '00', ...}
+
+        for slug_, table in main_table.items():
+            aka_slug = table.get(self._SZ_AKA_SLUG)  # NB: may be present, but None
+            has_aka = self._SZ_AKA_SLUG in table
+            has_default = bool(table.get(self._SZ_DEFAULT))
+
+            for k, v in table.items():
+                is_str_key = type(k) is str  # exact: the keys are literals, or None
+                if is_str_key and len(k) == 2:
+                    hex_lookup[k] = aka_slug if has_aka else slug_
+                if isinstance(v, str):  # NB: not type(): some values are StrEnums
+                    if has_default:
+                        slug_lookup[None] = slug_
+                    if aka_slug is None:
+                        str_lookup[v] = slug_
+                if is_str_key and k[:1] != "_":
+                    forward[k] = v
+                    if not has_aka:
+                        reverse[v] = k
+
+        slug_lookup.update(hex_lookup)
+        slug_lookup.update(str_lookup)
+        self._slug_lookup = slug_lookup
+        # the hex keys are dense in 0x00-0xFF: a tuple indexed by int(key, 16)
+        # answers slug() with a C-level load instead of a hash probe
+        self._slug_lookup_arr: tuple[str | None, ...] = tuple(
+            slug_lookup.get(f"{i:02X}") for i in range(256)
         )
-
-        self._forward = {
-            k: v
-            for table in main_table.values()
-            for k, v in table.items()
-            if isinstance(k, str) and k[:1] != "_"
-        }  # e.g. {'00': 'radiator_valve', '01': 'controller', ...}
-        self._reverse = {
-            v: k
-            for table in main_table.values()
-            for k, v in table.items()
-            if isinstance(k, str) and k[:1] != "_" and self._SZ_AKA_SLUG not in table
-        }  # e.g. {'radiator_valve': '00', 'controller': '01', ...}
-        self._forward = dict(sorted(self._forward.items(), key=lambda item: item[0]))
+        # NB: cannot insert pre-sorted (hex keys interleave across the subtables),
+        # but keys are unique, so items sort without a per-item key callable
+        self._forward = dict(sorted(forward.items()))
+        self._reverse = reverse
 
         super().__init__(self._forward)
 
+        # precomputed dispatch maps: known names answer with a single dict lookup,
+        # instead of chained `in` probes (and, for attrs, an exception-raise path)
+        self._getitem_map: dict = dict(self._reverse)  # map["dhw_sensor"] -> "0D"
+        self._getitem_map.update(
+            {k: next(iter(v.values())) for k, v in main_table.items()}
+        )  # map[ZON_ROLE.DHW] -> "dhw_sensor"
+
+        self._getattr_map: dict = {
+            v.upper(): k for v, k in self._reverse.items()
+        }  # map.DHW_SENSOR -> "0D"
+        self._getattr_map.update(
+            {f"_{k}": v for k, v in self._forward.items()}
+        )  # map._0D -> "dhw_sensor"
+        self._getattr_map.update(self._attr_table)  # bespoke attrs
+        self._getattr_map.update(
+            {
+                s: key
+                for s, table in main_table.items()
+                if (key := next(iter(table.keys()))) is not None
+            }
+        )  # map.DHW -> "0D" (using slug)
+
     def __getitem__(self, key):
-        if key in self._main_table:  # map[ZON_ROLE.DHW] -> "dhw_sensor"
-            return list(self._main_table[key].values())[0]
-        # if key in self._forward:  # map["0D"] -> "dhw_sensor"
-        #     return self._forward.__getitem__(key)
-        if key in self._reverse:  # map["dhw_sensor"] -> "0D"
-            return self._reverse.__getitem__(key)
-        return super().__getitem__(key)
+        try:
+            return self._getitem_map[key]
+        except KeyError:
+            return super().__getitem__(key)  # map["0D"] -> "dhw_sensor"
 
     def __getattr__(self, name):
-        if name in self._main_table:  # map.DHW -> "0D" (using slug)
-            if (result := list(self._main_table[name].keys())[0]) is not None:
-                return result
-        elif name in self._attr_table:  # bespoke attrs
-            return self._attr_table[name]
-        elif len(name) and name[1:] in self._forward:  # map._0D -> "dhw_sensor"
-            return self._forward[name[1:]]
-        elif name.isupper() and name.lower() in self._reverse:  # map.DHW_SENSOR -> "0D"
-            return self[name.lower()]
-        return self.__getattribute__(name)
+        try:
+            return self._getattr_map[name]
+        except KeyError:
+            return self.__getattribute__(name)
 
     def _hex(self, key) -> str:
         """Return the key/ID (2-byte hex string) of the two-way dict (e.g. '04')."""
         if key in self._main_table:
-            return list(self._main_table[key].keys())[0]  # type: ignore[no-any-return]
+            return next(iter(self._main_table[key]))  # type: ignore[no-any-return]
         if key in self._reverse:
             return self._reverse[key]
         raise KeyError(key)
@@ -186,7 +229,7 @@ class AttrDict(dict):
     def _str(self, key) -> str:
         """Return the value (string) of the two-way dict (e.g. 'radiator_valve')."""
         if key in self._main_table:
-            return list(self._main_table[key].values())[0]  # type: ignore[no-any-return]
+            return next(iter(self._main_table[key].values()))  # type: ignore[no-any-return]
         if key in self:
             return self[key]  # type: ignore[no-any-return]
         raise KeyError(key)
@@ -196,10 +239,18 @@ class AttrDict(dict):
 
     def slug(self, key) -> str:
         """WIP: Return master slug for a hex key/ID (e.g. 00 -> 'TRV', not 'TR0')."""
+        if (
+            isinstance(key, str)
+            and len(key) == 2
+            and key[0] in _HEX_CHARS
+            and key[1] in _HEX_CHARS  # int(key, 16) also accepts '-5', ' 5', '0d'
+        ):  # dense-index fast path for the (canonical) 2-char hex keys
+            if (slug_ := self._slug_lookup_arr[int(key, 16)]) is not None:
+                return slug_
         slug_ = self._slug_lookup[key]
         # if slug_ in self._attr_table["_TRANSFORMS"]:
         #     return self._attr_table["_TRANSFORMS"][slug_]
-        return slug_  # type: ignore[no-any-return]
+        return slug_
 
     def slugs(self) -> tuple:
         """Return the slugs from the main table."""
@@ -211,25 +262,12 @@ def attr_dict_factory(main_table, attr_table=None) -> AttrDict:  # is: SlottedAt
         attr_table = {}
 
     class SlottedAttrDict(AttrDict):
-        pass  # TODO: low priority
-        # __slots__ = (
-        #     list(main_table.keys())
-        #     + [
-        #         f"_{k}"
-        #         for t in main_table.values()
-        #         for k in t.keys()
-        #         if isinstance(k, str) and len(k) == 2
-        #     ]
-        #     + [v for t in main_table.values() for v in t.values()]
-        #         + list(attr_table.keys())
-        #         + [AttrDict._SZ_AKA_SLUG, AttrDict._SZ_SLUGS]
-        # )
+        __slots__ = ()  # the slug/hex attrs resolve via __getattr__, not __dict__
 
     return SlottedAttrDict(main_table, attr_table=attr_table)
 
 
 # slugs for device/zone entity klasses, used by 0005/000C
-@verify(EnumCheck.UNIQUE)
 class DevRole(StrEnum):
     #
     # Generic device/zone classes
@@ -279,7 +317,6 @@ DEV_ROLE_MAP = attr_dict_factory(
 
 
 # slugs for device entity types, used in device_ids
-@verify(EnumCheck.UNIQUE)
 class DevType(StrEnum):
     #
     # Promotable/Generic devices
@@ -502,7 +539,20 @@ DEFAULT_MAX_ZONES = 16 if DEV_MODE else 12
 # Sundial RF2: 2 (0-1), usually only one, but ST9520C can do two zones
 
 
-DEVICE_ID_REGEX = SimpleNamespace(
+class _DeviceIdRegex(NamedTuple):
+    """The device ID patterns (a NamedTuple: attr access without a __dict__ probe)."""
+
+    ANY: re.Pattern
+    BDR: re.Pattern
+    CTL: re.Pattern
+    DHW: re.Pattern
+    HGI: re.Pattern
+    APP: re.Pattern
+    UFC: re.Pattern
+    SEN: re.Pattern
+
+
+DEVICE_ID_REGEX = _DeviceIdRegex(
     ANY=re.compile(r"^[0-9]{2}:[0-9]{6}$"),
     BDR=re.compile(r"^13:[0-9]{6}$"),
     CTL=re.compile(r"^(01|23):[0-9]{6}$"),
@@ -513,8 +563,38 @@ DEVICE_ID_REGEX = SimpleNamespace(
     SEN=re.compile(r"^(01|03|04|12|22|34):[0-9]{6}$"),
 )
 
-# Domains
-F6, F7, F8, F9, FA, FB, FC, FD, FE, FF = (f"{x:02X}" for x in range(0xF6, 0x100))
+# the non-ANY patterns above differ only by their type prefix, so classification
+# needs one ANY match + a table probe, not an engine invocation per device klass
+_DEV_KLASS_BY_PREFIX: Final[dict[str, frozenset[str]]] = {
+    "01": frozenset({"CTL", "SEN"}),
+    "02": frozenset({"UFC"}),
+    "03": frozenset({"SEN"}),
+    "04": frozenset({"SEN"}),
+    "07": frozenset({"DHW"}),
+    "10": frozenset({"APP"}),
+    "12": frozenset({"SEN"}),
+    "13": frozenset({"APP", "BDR"}),
+    "18": frozenset({"HGI"}),
+    "22": frozenset({"SEN"}),
+    "23": frozenset({"CTL"}),
+    "34": frozenset({"SEN"}),
+}
+_NO_DEV_KLASS: Final[frozenset[str]] = frozenset()
+
+
+def classify_device_id(device_id: str) -> frozenset[str]:
+    """Return the device klasses implied by a device ID (e.g. {'CTL', 'SEN'})."""
+    if DEVICE_ID_REGEX.ANY.match(device_id):
+        return _DEV_KLASS_BY_PREFIX.get(device_id[:2], _NO_DEV_KLASS)
+    return _NO_DEV_KLASS
+
+# Domains (one C-level bytes.hex() pass, not ten f-string formats; interned, as
+# they are used as dict keys)
+_DOMAIN_IDS = bytes(range(0xF6, 0x100)).hex().upper()
+F6, F7, F8, F9, FA, FB, FC, FD, FE, FF = (
+    sys.intern(_DOMAIN_IDS[i : i + 2]) for i in range(0, 20, 2)
+)
+del _DOMAIN_IDS
 
 DOMAIN_TYPE_MAP: dict[str, str] = {
     F6: "cooling_valve",  # cooling
@@ -528,15 +608,36 @@ DOMAIN_TYPE_MAP: dict[str, str] = {
     # "FE": ???
     # FF: "system",  # TODO: remove this, is not a domain
 }  # "21": "Ventilation", "88": ???
-DOMAIN_TYPE_LOOKUP = {v: k for k, v in DOMAIN_TYPE_MAP.items() if k != FF}
+DOMAIN_TYPE_LOOKUP: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in DOMAIN_TYPE_MAP.items() if k != FF}
+)
+
+# the domain ids are dense in 0xF0-0xFF: serve lookups from a 16-entry tuple
+_DOMAIN_TYPE_ARR: Final[tuple[str | None, ...]] = tuple(
+    DOMAIN_TYPE_MAP.get(f"{i:02X}") for i in range(0xF0, 0x100)
+)
+
+
+def domain_type(hex2: str) -> str | None:
+    """Return the domain name for a domain id (e.g. 'FC' -> 'appliance_control')."""
+    try:
+        idx = int(hex2, 16) - 0xF0
+    except ValueError:  # not hex (e.g. 'HW')
+        return None
+    return _DOMAIN_TYPE_ARR[idx] if 0 <= idx < 0x10 else None
 
 DHW_STATE_MAP: dict[str, str] = {"00": "off", "01": "on"}
-DHW_STATE_LOOKUP = {v: k for k, v in DHW_STATE_MAP.items()}
+DHW_STATE_LOOKUP: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in DHW_STATE_MAP.items()}
+)
 
+# re.ASCII: \d is [0-9] (no Unicode digit tables) - these only ever see ASCII
 DTM_LONG_REGEX = re.compile(
-    r"\d{4}-[01]\d-[0-3]\d(T| )[0-2]\d:[0-5]\d:[0-5]\d\.\d{6} ?"
+    r"\d{4}-[01]\d-[0-3]\d(T| )[0-2]\d:[0-5]\d:[0-5]\d\.\d{6} ?", re.ASCII
 )  # 2020-11-30T13:15:00.123456
-DTM_TIME_REGEX = re.compile(r"[0-2]\d:[0-5]\d:[0-5]\d\.\d{3} ?")  # 13:15:00.123
+DTM_TIME_REGEX = re.compile(
+    r"[0-2]\d:[0-5]\d:[0-5]\d\.\d{3} ?", re.ASCII
+)  # 13:15:00.123
 
 # Used by packet structure validators
 r = r"(-{3}|\d{3}|\.{3})"  # RSSI, '...' was used by an older version of evofw3
@@ -547,34 +648,41 @@ l = r"\d{3}"  # length # noqa: E741
 p = r"([0-9A-F]{2}){1,48}"  # payload
 
 # DEVICE_ID_REGEX = re.compile(f"^{d}$")
-COMMAND_REGEX = re.compile(f"^{v} {r} {d} {d} {d} {c} {l} {p}$")
-MESSAGE_REGEX = re.compile(f"^{r} {v} {r} {d} {d} {d} {c} {l} {p}$")
-
-
-# Used by 0418/system_fault parser
-FAULT_DEVICE_CLASS: Final[dict[str, str]] = {
-    "00": "controller",
-    "01": "sensor",
-    "02": "setpoint",
-    "04": "actuator",  # if domain is FC, then "boiler_relay"
-    "05": "dhw_sensor",
-    "06": "rf_gateway",
-}
-FAULT_STATE: Final[dict[str, str]] = {
-    "00": "fault",
-    "40": "restore",
-    "C0": "unknown_c0",  # C0s do not appear in the evohome UI
-}
-FAULT_TYPE: Final[dict[str, str]] = {
-    "01": "system_fault",
-    "03": "mains_low",
-    "04": "battery_low",
-    "05": "battery_error",  # actually: 'evotouch_battery_error'
-    "06": "comms_fault",
-    "07": "sensor_fault",  # seen with zone sensor
-    "0A": "sensor_error",
-    "??": "bad_value",
-}
+COMMAND_REGEX = re.compile(f"^{v} {r} {d} {d} {d} {c} {l} {p}$", re.ASCII)
+MESSAGE_REGEX = re.compile(f"^{r} {v} {r} {d} {d} {d} {c} {l} {p}$", re.ASCII)
+
+
+# Used by 0418/system_fault parser (read-only: the keys are not contiguous hex, so
+# these stay as mappings, not tuple-indexed arrays)
+FAULT_DEVICE_CLASS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "00": "controller",
+        "01": "sensor",
+        "02": "setpoint",
+        "04": "actuator",  # if domain is FC, then "boiler_relay"
+        "05": "dhw_sensor",
+        "06": "rf_gateway",
+    }
+)
+FAULT_STATE: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "00": "fault",
+        "40": "restore",
+        "C0": "unknown_c0",  # C0s do not appear in the evohome UI
+    }
+)
+FAULT_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "01": "system_fault",
+        "03": "mains_low",
+        "04": "battery_low",
+        "05": "battery_error",  # actually: 'evotouch_battery_error'
+        "06": "comms_fault",
+        "07": "sensor_fault",  # seen with zone sensor
+        "0A": "sensor_error",
+        "??": "bad_value",
+    }
+)
 
 
 class SystemType(StrEnum):
@@ -624,7 +732,6 @@ W_: Final[Verb] = " W"
 
 
 # StrEnum is intended include all known codes, see: test suite, code schema in ramses.py
-@verify(EnumCheck.UNIQUE)
 class Code(StrEnum):
     _0001 = "0001"
     _0002 = "0002"
@@ -731,6 +838,12 @@ class Code(StrEnum):
     _PUZZ = "7FFF"  # for internal use: not to be a RAMSES II code
 
 
+# hot-path alternatives to the EnumMeta machinery: `s in CODE_SET` instead of a
+# try/except around Code(s), and CODE_MEMBERS[s] for the member itself
+CODE_SET: Final[frozenset[str]] = frozenset(c.value for c in Code)
+CODE_MEMBERS: Final[dict[str, Code]] = {c.value: c for c in Code}
+
+
 # fmt: off
 Index = Literal[
     "00", "01", "02", "03", "04", "05", "06", "07", "08", "09", "0A", "0B", "0C", "0D", "0E", "0F",
@@ -738,3 +851,11 @@ Index = Literal[
     "F0", "F1", "F2", "F3", "F4", "F5", "F6", "F7", "F8", "F9", "FA", "FB", "FC", "FD", "FE", "FF"
 ]
 # fmt: on
+
+
+# the SZ_* sentinels are used as dict keys throughout the decoder: interning them
+# guarantees the id()-based fast path when compared against strings built at runtime
+for _name, _value in list(globals().items()):
+    if _name.startswith("SZ_"):
+        globals()[_name] = sys.intern(_value)
+del _name, _value
@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING
 
 from . import exceptions as exc
 from .address import NON_DEV_ADDR, NUL_DEV_ADDR, Address, pkt_addrs
-from .const import COMMAND_REGEX, DEV_ROLE_MAP, DEV_TYPE_MAP
+from .const import CODE_MEMBERS, COMMAND_REGEX, DEV_ROLE_MAP, DEV_TYPE_MAP
 from .ramses import (
     CODE_IDX_COMPLEX,
     CODE_IDX_DOMAIN,
@@ -56,6 +56,54 @@ _HeaderT = str
 _PayloadT = str
 _PktIdxT = str
 
+# Canonical verb/code instances: frame-parsing would otherwise yield a fresh str slice
+# per packet, so dict lookups keyed by verb/code (e.g. _msgz, CODES_SCHEMA) couldn't
+# short-circuit on identity - map each slice to its single shared (interned) object
+_VERB_LOOKUP: dict[str, Verb] = {v: v for v in (I_, RQ, RP, W_)}
+_CODE_LOOKUP: dict[str, Code] = CODE_MEMBERS  # shared with const.py
+
+_HEX_CHARS = "0123456789ABCDEF"
+_DIGIT_CHARS = "0123456789"
+
+
+def _frame_is_wellformed(frame: str) -> bool:
+    """Return True if the frame is structurally valid (w/o a regex engine pass).
+
+    The frame grammar is fixed-width, so slice + charset checks suffice: a str
+    is all-hex/all-digit iff stripping that charset consumes it entirely.
+    """
+
+    if len(frame) < 48 or (  # 48 is the shortest valid frame (2-char payload)
+        frame[2] != " "
+        or frame[6] != " "
+        or frame[16] != " "
+        or frame[26] != " "
+        or frame[36] != " "
+        or frame[41] != " "
+        or frame[45] != " "
+        or frame[:2] not in _VERB_LOOKUP
+    ):
+        return False
+
+    seqn = frame[3:6]
+    if seqn not in ("---", "...") and seqn.strip(_DIGIT_CHARS):
+        return False
+
+    for i in (7, 17, 27):  # the three addresses
+        addr = frame[i : i + 9]
+        if addr != "--:------" and (
+            addr[2] != ":"
+            or addr[:2].strip(_DIGIT_CHARS)
+            or addr[3:].strip(_DIGIT_CHARS)
+        ):
+            return False
+
+    if frame[37:41].strip(_HEX_CHARS) or frame[42:45].strip(_DIGIT_CHARS):
+        return False
+
+    payload = frame[46:]
+    return not (len(payload) % 2 or len(payload) > 96 or payload.strip(_HEX_CHARS))
+
 
 class Frame:
     """The Frame class - used as a base by the Command and Packet classes.
@@ -74,14 +122,17 @@ class Frame:
         """
 
         self._frame: str = frame
-        if not COMMAND_REGEX.match(self._frame):
+        if not _frame_is_wellformed(frame) and not COMMAND_REGEX.match(frame):
+            # the regex remains the arbiter for oddities (e.g. unicode digits)
             raise exc.PacketInvalid(f"Bad frame: invalid structure: >>>{frame}<<<")
 
         fields = frame.lstrip().split(" ")
 
-        self.verb: Verb = frame[:2]  # type: ignore[assignment]
+        verb = frame[:2]
+        self.verb: Verb = _VERB_LOOKUP.get(verb, verb)  # type: ignore[arg-type]
         self.seqn: str = fields[1]  # frame[3:6]
-        self.code: Code | str = fields[5]  # frame[37:41]  FIXME: use Code, not str
+        code = fields[5]
+        self.code: Code | str = _CODE_LOOKUP.get(code, code)  # frame[37:41]
         self.len_: str = fields[6]  # frame[42:45]  FIXME: len_, _len & len(payload)/2
         self.payload: _PayloadT = fields[7]  # frame[46:].split(" ")[0]
         self._len: int = int(len(self.payload) / 2)
@@ -6,8 +6,9 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
+from collections.abc import Callable, Iterable
 from datetime import datetime as dt, timedelta as td
-from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from . import exceptions as exc
@@ -44,12 +45,69 @@ if TYPE_CHECKING:  # mypy TypeVars and similar (e.g. Index, Verb)
 __all__ = ["Message"]
 
 
-CODE_NAMES = {k: v["name"] for k, v in CODES_SCHEMA.items()}
+class _CodeNames(dict):
+    """A dict of code names that caches (interned) names for unknown codes too."""
 
-MSG_FORMAT_10 = "|| {:10s} | {:10s} | {:2s} | {:16s} | {:^4s} || {}"
+    __slots__ = ()
+
+    def __missing__(self, code: str) -> str:
+        name = self[code] = sys.intern(f"unknown_{code}")
+        return name
+
+
+CODE_NAMES = _CodeNames(
+    {k: sys.intern(v["name"]) for k, v in CODES_SCHEMA.items()}
+)
+
+_CTX_MAP = {True: "[..]", False: "", None: "??"}  # for __str__
 
 _TD_SECS_003 = td(seconds=3)
 
+# RQs for these codes have no payload to parse (by this point unknown codes have
+# already been rejected, so the set can be anchored to the schema)
+_RQ_NO_IDX_CODES = frozenset(CODES_SCHEMA) - frozenset(RQ_IDX_COMPLEX)
+
+# constants for _idx (hoisted: they were rebuilt per message)
+_IDX_NAMES = {
+    Code._0002: "other_idx",  # non-evohome: hometronics
+    Code._0418: SZ_LOG_IDX,
+    Code._10A0: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
+    Code._1260: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
+    Code._1F41: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
+    Code._22C9: SZ_UFH_IDX,  # UFH circuit
+    Code._2389: "other_idx",  # anachronistic
+    Code._2D49: "other_idx",  # non-evohome: hometronics
+    Code._31D9: "hvac_id",
+    Code._31DA: "hvac_id",
+    Code._3220: "msg_id",
+}  # ALSO: SZ_DOMAIN_ID, SZ_ZONE_IDX
+_IDX_NAMES = {k: sys.intern(v) for k, v in _IDX_NAMES.items()}  # pointer-equal keys
+
+# shared by every no-idx branch of _compute_idx (the majority): callers only ever
+# read or spread the result, so one dict serves them all
+_EMPTY_IDX: dict = {}
+
+# one bit per device type of interest: the _idx membership tests then reduce to
+# two dict probes and a mask, with no per-message set construction
+_DEV_TYPE_BITS: dict[str, int] = {
+    dev_type: 1 << i
+    for i, dev_type in enumerate(
+        (
+            DEV_TYPE_MAP.CTL,
+            DEV_TYPE_MAP.UFC,
+            DEV_TYPE_MAP.HCW,  # ?remove (see _idx, rare)
+            DEV_TYPE_MAP.DTS,
+            DEV_TYPE_MAP.HGI,
+            DEV_TYPE_MAP.DT2,
+            DEV_TYPE_MAP.PRG,
+        )
+    )
+}
+_IDX_TYPES_MASK = sum(_DEV_TYPE_BITS.values())  # DEX: all of the above
+_CTL_TYPES_MASK = _IDX_TYPES_MASK & ~(
+    _DEV_TYPE_BITS[DEV_TYPE_MAP.DTS] | _DEV_TYPE_BITS[DEV_TYPE_MAP.DT2]
+)  # DEX: the above, less the two thermostats
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +115,25 @@ _LOGGER = logging.getLogger(__name__)
 class MessageBase:
     """The Message class; will trap/log invalid msgs."""
 
+    __slots__ = (
+        "_pkt",
+        "src",
+        "dst",
+        "_addrs",
+        "dtm",
+        "verb",
+        "seqn",
+        "code",
+        "len",
+        "_ctx",
+        "_hdr",
+        "_idx_",
+        "_payload",
+        "_str",
+        "_public_payload_",
+        "_identity",
+    )
+
     def __init__(self, pkt: Packet) -> None:
         """Create a message from a valid packet.
 
@@ -76,9 +153,13 @@ class MessageBase:
         self.code: str = pkt.code
         self.len: int = pkt._len
 
+        self._idx_: dict = None  # type: ignore[assignment]  # must pre-date _validate
+
         self._payload = self._validate(self._pkt.payload)  # ? raise InvalidPacketError
 
         self._str: str = None  # type: ignore[assignment]
+        self._public_payload_: dict = None  # type: ignore[assignment]
+        self._identity: tuple | None = None
 
     def __repr__(self) -> str:
         """Return an unambiguous string representation of this object."""
@@ -88,7 +169,7 @@ class MessageBase:
         """Return a brief readable string representation of this object."""
 
         def ctx(pkt: Packet) -> str:
-            ctx = {True: "[..]", False: "", None: "??"}.get(pkt._ctx, pkt._ctx)  # type: ignore[arg-type]
+            ctx = _CTX_MAP.get(pkt._ctx, pkt._ctx)  # type: ignore[arg-type]
             if not ctx and pkt.payload[:2] not in ("00", "FF"):
                 return f"({pkt.payload[:2]})"
             return ctx
@@ -96,29 +177,40 @@ class MessageBase:
         if self._str is not None:
             return self._str
 
-        if self.src.id == self._addrs[0].id:
+        src_id = self.src.id  # ids are interned: == is a pointer compare
+        if src_id == self._addrs[0].id:
             name_0 = self._name(self.src)
-            name_1 = "" if self.dst is self.src else self._name(self.dst)
+            name_1 = "" if self.dst.id == src_id else self._name(self.dst)
         else:
             name_0 = ""
             name_1 = self._name(self.src)
 
-        code_name = CODE_NAMES.get(self.code, f"unknown_{self.code}")
-        self._str = MSG_FORMAT_10.format(
-            name_0, name_1, self.verb, code_name, ctx(self._pkt), self.payload
+        code_name = CODE_NAMES[self.code]  # unknown codes yield 'unknown_<code>'
+        self._str = (
+            f"|| {name_0:10s} | {name_1:10s} | {self.verb:2s} | {code_name:16s} "
+            f"| {ctx(self._pkt):^4s} || {self.payload}"
         )
         return self._str
 
+    def _id(self) -> tuple:
+        """Return (and cache) the tuple used for equality/hashing."""
+        if self._identity is None:
+            self._identity = (
+                self.src.id,
+                self.dst.id,
+                self.verb,
+                self.code,
+                self._pkt.payload,
+            )
+        return self._identity
+
     def __eq__(self, other) -> bool:
         if not isinstance(other, Message):
             return NotImplemented
-        return (self.src, self.dst, self.verb, self.code, self._pkt.payload) == (
-            other.src,
-            other.dst,
-            other.verb,
-            other.code,
-            other._pkt.payload,
-        )
+        return self._id() == other._id()
+
+    def __hash__(self) -> int:
+        return hash(self._id())
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, Message):
@@ -134,6 +226,21 @@ class MessageBase:
         """Return the payload."""
         return self._payload
 
+    @property
+    def _public_payload(self) -> dict:
+        """Return the dict payload, stripped of indices/private keys (lazily cached).
+
+        Only valid for messages with a dict payload (i.e. not arrays).
+        """
+
+        if self._public_payload_ is None:
+            self._public_payload_ = {
+                k: v
+                for k, v in self._payload.items()
+                if k not in (SZ_DHW_IDX, SZ_DOMAIN_ID, SZ_ZONE_IDX) and k[:1] != "_"
+            }
+        return self._public_payload_
+
     @property
     def _has_payload(self) -> bool:
         """Return False if there is no payload (may falsely Return True).
@@ -154,59 +261,39 @@ class MessageBase:
         """Return the domain_id/zone_idx/other_idx of a message payload, if any.
 
         Used to identify the zone/domain that a message applies to. Returns an empty
-        dict if there is none such, or None if undetermined.
+        dict if there is none such, or None if undetermined. The result is cached
+        (it depends only on pkt fields), see: _force_has_array().
         """
 
-        # .I --- 01:145038 --:------ 01:145038 3B00 002 FCC8
+        if self._idx_ is None:
+            self._idx_ = self._compute_idx()
+        return self._idx_
 
-        IDX_NAMES = {
-            Code._0002: "other_idx",  # non-evohome: hometronics
-            Code._0418: SZ_LOG_IDX,
-            Code._10A0: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
-            Code._1260: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
-            Code._1F41: SZ_DHW_IDX,  # can be 2 DHW zones per system, albeit unusual
-            Code._22C9: SZ_UFH_IDX,  # UFH circuit
-            Code._2389: "other_idx",  # anachronistic
-            Code._2D49: "other_idx",  # non-evohome: hometronics
-            Code._31D9: "hvac_id",
-            Code._31DA: "hvac_id",
-            Code._3220: "msg_id",
-        }  # ALSO: SZ_DOMAIN_ID, SZ_ZONE_IDX
+    def _compute_idx(self) -> dict:
+        # .I --- 01:145038 --:------ 01:145038 3B00 002 FCC8
 
         if self.code in (Code._31D9, Code._31DA):  # shouldn't be needed?
             return {"hvac_id": self._pkt._idx}
 
         if self._pkt._idx in (True, False) or self.code in CODE_IDX_COMPLEX:
-            return {}  # above was: CODE_IDX_COMPLEX + (Code._3150):
+            return _EMPTY_IDX  # above was: CODE_IDX_COMPLEX + (Code._3150):
 
         if self.code in (Code._3220,):  # FIXME: should be _SIMPLE
-            return {}
+            return _EMPTY_IDX
 
         # .I 068 03:201498 --:------ 03:201498 30C9 003 0106D6 # rare
 
+        src_bit = _DEV_TYPE_BITS.get(self.src.type, 0)
+
         # .I --- 00:034798 --:------ 12:126457 2309 003 0201F4
-        if not {self.src.type, self.dst.type} & {
-            DEV_TYPE_MAP.CTL,
-            DEV_TYPE_MAP.UFC,
-            DEV_TYPE_MAP.HCW,  # ?remove (see above, rare)
-            DEV_TYPE_MAP.DTS,
-            DEV_TYPE_MAP.HGI,
-            DEV_TYPE_MAP.DT2,
-            DEV_TYPE_MAP.PRG,
-        }:  # DEX
+        if not (src_bit | _DEV_TYPE_BITS.get(self.dst.type, 0)) & _IDX_TYPES_MASK:  # DEX
             assert self._pkt._idx == "00", "What!! (AA)"
-            return {}
+            return _EMPTY_IDX
 
         # .I 035 --:------ --:------ 12:126457 30C9 003 017FFF
-        if self.src.type == self.dst.type and self.src.type not in (
-            DEV_TYPE_MAP.CTL,
-            DEV_TYPE_MAP.UFC,
-            DEV_TYPE_MAP.HCW,  # ?remove (see above, rare)
-            DEV_TYPE_MAP.HGI,
-            DEV_TYPE_MAP.PRG,
-        ):  # DEX
+        if self.src.type == self.dst.type and not src_bit & _CTL_TYPES_MASK:  # DEX
             assert self._pkt._idx == "00", "What!! (AB)"
-            return {}
+            return _EMPTY_IDX
 
         # .I --- 04:029362 --:------ 12:126457 3150 002 0162
         # if not getattr(self.src, "_is_controller", True) and not getattr(
@@ -227,16 +314,16 @@ class MessageBase:
             self.src, "_is_controller", True
         ):  # DEX
             assert self._pkt._idx == "00", "What!! (BC)"
-            return {}
+            return _EMPTY_IDX
 
         # TODO: also 000C (but is a complex idx)
         # TODO: also 3150 (when not domain, and will be array if so)
         if self.code in (Code._000A, Code._2309) and self.src.type == DEV_TYPE_MAP.UFC:
-            return {IDX_NAMES[Code._22C9]: self._pkt._idx}
+            return {_IDX_NAMES[Code._22C9]: self._pkt._idx}
 
         assert isinstance(self._pkt._idx, str)  # mypy check
         idx_name = SZ_DOMAIN_ID if self._pkt._idx[:1] == "F" else SZ_ZONE_IDX
-        index_name = IDX_NAMES.get(self.code, idx_name)  # type: ignore[call-overload]
+        index_name = _IDX_NAMES.get(self.code, idx_name)  # type: ignore[call-overload]
 
         return {index_name: self._pkt._idx}
 
@@ -247,11 +334,18 @@ class MessageBase:
         """
 
         try:  # parse the payload
+            # cache these from the pkt (saves an attr descend per use), in here so a
+            # bad idx is logged below as before, see: _force_has_array()
+            self._ctx: bool | str = self._pkt._ctx
+            self._hdr: str = self._pkt._hdr
+
             # TODO: only accept invalid packets to/from HGI when flag raised
             _check_msg_payload(self, self._pkt.payload)  # ? InvalidPayloadError
 
-            if not self._has_payload and (
-                self.verb == RQ and self.code not in RQ_IDX_COMPLEX
+            if (
+                self.verb == RQ
+                and not self._has_payload
+                and self.code in _RQ_NO_IDX_CODES
             ):
                 # _LOGGER.error("%s", msg)
                 return {}
@@ -261,7 +355,8 @@ class MessageBase:
             if isinstance(result, list):
                 return result
             if isinstance(result, dict):
-                return {**self._idx, **result}
+                # idx is empty for most messages: skip the merge allocation then
+                return {**idx, **result} if (idx := self._idx) else result
 
             raise TypeError(f"Invalid payload type: {type(result)}")
 
@@ -291,57 +386,105 @@ class Message(MessageBase):  # add _expired attr
     Adds _expired attr to the Message class.
     """
 
-    CANT_EXPIRE = -1  # sentinel value for fraction_expired
+    __slots__ = ("_gwy", "_expires_at")
 
-    HAS_EXPIRED = 2.0  # fraction_expired >= HAS_EXPIRED
-    # .HAS_DIED = 1.0  # fraction_expired >= 1.0 (is expected lifespan)
-    IS_EXPIRING = 0.8  # fraction_expired >= 0.8 (and < HAS_EXPIRED)
+    HAS_EXPIRED = 2.0  # expired when older than lifespan * HAS_EXPIRED
+    # .HAS_DIED = 1.0  # older than 1.0 * lifespan (is expected lifespan)
+    IS_EXPIRING = 0.8  # older than 0.8 * lifespan (and < HAS_EXPIRED)
 
-    _gwy: Gateway = None  # FIXME: where does this get set?
-    _fraction_expired: float | None = None
+    def __init__(self, pkt: Packet) -> None:
+        super().__init__(pkt)
+        self._gwy: Gateway = None  # type: ignore[assignment]  # set by the Gateway
+        self._expires_at: dt | bool | None = None  # None: not yet computed
+
+    @classmethod
+    def from_packets(cls, pkts: Iterable[Packet]) -> list[Message]:
+        """Decode a batch of packets, silently dropping any invalid ones.
+
+        Useful when replaying a packet log, where per-packet try/except at the
+        call site would be repeated thousands of times.
+        """
+        out: list[Message] = []
+        append = out.append
+        for pkt in pkts:
+            try:
+                append(cls(pkt))
+            except exc.PacketInvalid:
+                continue
+        return out
 
     @property
     def _expired(self) -> bool:
         """Return True if the message is dated (or False otherwise)."""
-        # fraction_expired = (dt_now - self.dtm - _TD_SECONDS_003) / self._pkt._lifespan
+        # the deadline is computed once: thereafter, each check is a single datetime
+        # comparison (rather than two timedelta subtractions and a division)
         # TODO: keep none >7d, even 10E0, etc.
 
-        def fraction_expired(lifespan: td) -> float:
-            """Return the packet's age as fraction of its 'normal' life span."""
-            return (self._gwy._dt_now() - self.dtm - _TD_SECS_003) / lifespan  # type: ignore[no-any-return]
+        if (expires_at := self._expires_at) is None:
+            if self.code == Code._1F09 and self.verb != RQ:  # sync_cycle special case
+                # RQs won't have remaining_seconds, RP/Ws have partial cycle times
+                lifespan = td(seconds=self.payload["remaining_seconds"])
 
-        # 1. Look for easy win...
-        if self._fraction_expired is not None:
-            if self._fraction_expired == self.CANT_EXPIRE:
+            elif self._pkt._lifespan is False:  # Can't expire
+                self._expires_at = False
                 return False
-            if self._fraction_expired >= self.HAS_EXPIRED:
-                return True
-
-        # 2. Need to update the fraction_expired...
-        if self.code == Code._1F09 and self.verb != RQ:  # sync_cycle is a special case
-            # RQs won't have remaining_seconds, RP/Ws have only partial cycle times
-            self._fraction_expired = fraction_expired(
-                td(seconds=self.payload["remaining_seconds"]),
-            )
 
-        elif self._pkt._lifespan is False:  # Can't expire
-            self._fraction_expired = self.CANT_EXPIRE
+            elif self._pkt._lifespan is True:  # Can't expire
+                raise NotImplementedError
 
-        elif self._pkt._lifespan is True:  # Can't expire
-            raise NotImplementedError
+            else:
+                lifespan = self._pkt._lifespan
 
-        else:
-            self._fraction_expired = fraction_expired(self._pkt._lifespan)
+            expires_at = self.dtm + _TD_SECS_003 + lifespan * self.HAS_EXPIRED
+            self._expires_at = expires_at
+
+        elif expires_at is False:  # Can't expire
+            return False
+
+        # _gwy is untyped here, so _dt_now() is Any
+        return self._gwy._dt_now() >= expires_at  # type: ignore[no-any-return]
+
+
+# the payload schema is finite & known, so compile it once at import: the hot path
+# is then a single dict probe + match (not an lru/re-cache lookup per message)
+_COMPILED_SCHEMA: dict[tuple[str, str], re.Pattern] = {
+    (code, verb): re.compile(regex)
+    for code, schema in CODES_SCHEMA.items()
+    for verb, regex in schema.items()
+    if verb in (I_, RQ, RP, W_)
+}
+
+_HEX_CHARS = "0123456789ABCDEF"
 
-        return self._fraction_expired >= self.HAS_EXPIRED
+# the commonest payload schemas are trivial: a hex literal, optionally followed by
+# a fixed run of hex chars (e.g. '^00$', '^00[0-9A-F]{4}$', '^00'): such shapes are
+# validated with plain string ops, which beat the regex VM for these patterns
+_SIMPLE_SCHEMA_RE = re.compile(r"^\^([0-9A-F]*)(?:\[0-9A-F\]\{(\d+)\})?(\$)?$")
 
 
-@lru_cache(maxsize=256)
-def re_compile_re_match(regex: str, string: str) -> bool:  # Optional[Match[Any]]
-    # TODO: confirm this does speed things up
-    # Python has its own caching of re.complile, _MAXCACHE = 512
-    # https://github.com/python/cpython/blob/3.10/Lib/re.py
-    return re.compile(regex).match(string)  # type: ignore[return-value]
+def _make_validator(pattern: re.Pattern) -> Callable[[str], object]:
+    """Return a specialized validator for a trivial schema, else Pattern.match."""
+
+    if (m := _SIMPLE_SCHEMA_RE.match(pattern.pattern)) is None:
+        return pattern.match
+
+    literal, width, anchored = m.group(1), m.group(2), m.group(3)
+    if not anchored:
+        if width is not None:  # e.g. '^00[0-9A-F]{4}' - none in practice, be safe
+            return pattern.match
+        return lambda p, _lit=literal: p.startswith(_lit)  # type: ignore[misc]
+    if width is None:  # e.g. '^00$'
+        return lambda p, _lit=literal: p == _lit  # type: ignore[misc]
+
+    length = len(literal) + int(width)  # e.g. '^00[0-9A-F]{4}$'
+    return lambda p, _lit=literal, _len=length: (  # type: ignore[misc]
+        len(p) == _len and p.startswith(_lit) and not p.strip(_HEX_CHARS)
+    )
+
+
+_VALIDATORS: dict[tuple[str, str], Callable[[str], object]] = {
+    key: _make_validator(pattern) for key, pattern in _COMPILED_SCHEMA.items()
+}
 
 
 def _check_msg_payload(msg: MessageBase, payload: str) -> None:
@@ -351,17 +494,18 @@ def _check_msg_payload(msg: MessageBase, payload: str) -> None:
     actually be valid, in which case the rules (likely the regex) will need updating.
     """
 
-    _ = repr(msg._pkt)  # HACK: ? raise InvalidPayloadError
-
-    if msg.code not in CODES_SCHEMA:
-        raise exc.PacketInvalid(f"Unknown code: {msg.code}")
+    # NOTE: was `_ = repr(msg._pkt)` to force the pkt's lazy parse - no longer needed:
+    # _validate materializes pkt._ctx/_hdr (and so _idx) before these checks
 
-    try:
-        regex = CODES_SCHEMA[msg.code][msg.verb]  # type: ignore[index]
-    except KeyError:
+    if (validator := _VALIDATORS.get((msg.code, msg.verb))) is None:
+        if msg.code not in CODES_SCHEMA:
+            raise exc.PacketInvalid(f"Unknown code: {msg.code}")
         raise exc.PacketInvalid(
             f"Unknown verb/code pair: {msg.verb}/{msg.code}"
         ) from None
 
-    if not re_compile_re_match(regex, payload):
-        raise exc.PacketPayloadInvalid(f"Payload doesn't match '{regex}': {payload}")
+    if not validator(payload):
+        pattern = _COMPILED_SCHEMA[(msg.code, msg.verb)]
+        raise exc.PacketPayloadInvalid(
+            f"Payload doesn't match '{pattern.pattern}': {payload}"
+        )
@@ -9,14 +9,13 @@ from __future__ import annotations
 
 import struct
 from collections.abc import Callable
-from enum import EnumCheck, StrEnum, verify
+from enum import StrEnum
 from typing import Final, TypeAlias
 
 _MsgIdStrT: TypeAlias = str  # TODO: use only int
 _FlagsSchemaT: TypeAlias = dict[int, dict[str, str]]
 
 
-@verify(EnumCheck.UNIQUE)
 class MsgId(StrEnum):
     STATUS = "00"
     CONTROL_SETPOINT = "01"
@@ -205,7 +204,6 @@ SZ_VALUE_HB: Final[str] = f"{SZ_VALUE}_{HB}"
 SZ_VALUE_LB: Final[str] = f"{SZ_VALUE}_{LB}"
 
 
-@verify(EnumCheck.UNIQUE)
 class Sensor(StrEnum):  # all are F8_8, except COUNTER, CO2_LEVEL
     COUNTER = "counter"
     RATIO = "ratio"
@@ -218,7 +216,6 @@ class Sensor(StrEnum):  # all are F8_8, except COUNTER, CO2_LEVEL
     CO2_LEVEL = "CO2 (ppm)"
 
 
-@verify(EnumCheck.UNIQUE)
 class OtMsgType(StrEnum):
     READ_DATA = "Read-Data"
     WRITE_DATA = "Write-Data"
@@ -27,10 +27,7 @@ from .helpers import dt_now
 from .logger import set_logger_timesource
 from .message import Message
 from .packet import Packet
-from .protocol_fsm import (
-    ProtocolContext,
-    SendPriority,
-)
+from .protocol_fsm import ProtocolContext
 from .schemas import SZ_PORT_NAME
 from .transport import transport_factory
 from .typing import (
@@ -42,6 +39,7 @@ from .typing import (
     QosParams,
     RamsesProtocolT,
     RamsesTransportT,
+    SendPriority,
 )
 
 from .const import (  # noqa: F401, isort: skip, pylint: disable=unused-import
@@ -375,7 +373,7 @@ class _BaseProtocol(asyncio.Protocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,
     ) -> Packet | None:
         """This is the wrapper for self._send_cmd(cmd)."""
@@ -405,7 +403,7 @@ class _BaseProtocol(asyncio.Protocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,
     ) -> Packet | None:  # only cmd, no args, kwargs
         """This is the wrapper for self._send_frame(cmd), with repeats.
@@ -495,7 +493,7 @@ class ReadProtocol(_BaseProtocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,
     ) -> Packet | None:
         """Raise an exception as the Protocol cannot send Commands."""
@@ -584,7 +582,7 @@ class PortProtocol(_BaseProtocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,
     ) -> Packet | None:
         """Send a Command without QoS (send an impersonation alert if required)."""
@@ -668,7 +666,7 @@ class QosProtocol(PortProtocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,
     ) -> Packet | None:
         """Wrapper to send a Command with QoS (retries, until success or exception)."""
@@ -703,7 +701,7 @@ class QosProtocol(PortProtocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,  # max_retries, timeout, wait_for_reply
     ) -> Packet | None:
         """Send a Command with Qos (with retries, until success or ProtocolError).
@@ -24,7 +24,6 @@ from .typing import (
     QosParams,
     RamsesProtocolT,
     RamsesTransportT,
-    SendPriority,
 )
 
 from .const import (  # noqa: F401, isort: skip, pylint: disable=unused-import
@@ -91,6 +90,7 @@ class ProtocolContext:
         self._loop = asyncio.get_running_loop()
         self._que: PriorityQueue = PriorityQueue(maxsize=self.MAX_BUFFER_SIZE)
         self._mutex = Lock()
+        self._state_event = asyncio.Event()  # set on every transition (e.g. for tests)
 
         self.set_state(Inactive)  # set initiate state, pre connection_made
 
@@ -127,6 +127,8 @@ class ProtocolContext:
             setattr(self._state, "_prev_state", prev_state)  # noqa: B010
         # TODO: release lock
 
+        self._state_event.set()  # wake any waiters (they check state, then clear)
+
         if isinstance(self._state, IsInIdle | IsFailed):
             self._ensure_queue_processor()  # because just became Idle
 
@@ -169,7 +171,7 @@ class ProtocolContext:
         self,
         send_fnc: Callable[[Command], Coroutine[Any, Any, None]],
         cmd: Command,
-        priority: SendPriority,
+        priority: int,
         qos: QosParams,
     ) -> Packet:
         """Send the Command (with retries) and wait for the expected Packet.
@@ -1138,25 +1138,21 @@ CODES_BY_DEV_SLUG: dict[str, dict] = {
     **{k: v for k, v in _DEV_KLASSES_HEAT.items() if k is not None},
 }
 
-CODES_OF_HEAT_DOMAIN: tuple[Code] = sorted(  # type: ignore[assignment]
-    tuple(set(c for k in _DEV_KLASSES_HEAT.values() for c in k))
-    + (Code._0B04, Code._2389)
+# frozensets: these are only ever membership-tested (per-packet, in the dispatcher)
+CODES_OF_HEAT_DOMAIN: frozenset[Code] = frozenset(
+    set(c for k in _DEV_KLASSES_HEAT.values() for c in k) | {Code._0B04, Code._2389}
 )
-CODES_OF_HVAC_DOMAIN: tuple[Code] = sorted(  # type: ignore[assignment]
-    tuple(set(c for k in _DEV_KLASSES_HVAC.values() for c in k))
-    + (Code._22F8, Code._4401, Code._4E01, Code._4E02, Code._4E04)
-)
-CODES_OF_HEAT_DOMAIN_ONLY: tuple[Code, ...] = tuple(
-    c for c in sorted(CODES_OF_HEAT_DOMAIN) if c not in CODES_OF_HVAC_DOMAIN
-)
-CODES_OF_HVAC_DOMAIN_ONLY: tuple[Code, ...] = tuple(
-    c for c in sorted(CODES_OF_HVAC_DOMAIN) if c not in CODES_OF_HEAT_DOMAIN
+CODES_OF_HVAC_DOMAIN: frozenset[Code] = frozenset(
+    set(c for k in _DEV_KLASSES_HVAC.values() for c in k)
+    | {Code._22F8, Code._4401, Code._4E01, Code._4E02, Code._4E04}
 )
+CODES_OF_HEAT_DOMAIN_ONLY: frozenset[Code] = CODES_OF_HEAT_DOMAIN - CODES_OF_HVAC_DOMAIN
+CODES_OF_HVAC_DOMAIN_ONLY: frozenset[Code] = CODES_OF_HVAC_DOMAIN - CODES_OF_HEAT_DOMAIN
 _CODES_OF_BOTH_DOMAINS: tuple[Code, ...] = tuple(
-    sorted(set(CODES_OF_HEAT_DOMAIN) & set(CODES_OF_HVAC_DOMAIN))
+    sorted(CODES_OF_HEAT_DOMAIN & CODES_OF_HVAC_DOMAIN)
 )
 _CODES_OF_EITHER_DOMAIN: tuple[Code, ...] = tuple(
-    sorted(set(CODES_OF_HEAT_DOMAIN) | set(CODES_OF_HVAC_DOMAIN))
+    sorted(CODES_OF_HEAT_DOMAIN | CODES_OF_HVAC_DOMAIN)
 )
 _CODES_OF_NO_DOMAIN: tuple[Code, ...] = tuple(
     c for c in CODES_SCHEMA if c not in _CODES_OF_EITHER_DOMAIN
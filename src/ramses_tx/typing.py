@@ -4,9 +4,9 @@
 """RAMSES RF - Typing for RamsesProtocol & RamsesTransport."""
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime as dt
-from enum import IntEnum
-from typing import Any, Protocol, TypeVar
+from typing import Any, Final, Protocol, TypeVar
 
 from .command import Command
 from .message import Message
@@ -25,82 +25,58 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_TIMEOUT = 30.0  # total waiting for successful send: FIXME
 
 
-class SendPriority(IntEnum):
-    _MAX = -9
-    HIGH = -2
-    DEFAULT = 0
-    LOW = 2
-    _MIN = 9
+class SendPriority:  # not an IntEnum: queue ordering wants bare int compares
+    __slots__ = ()
 
+    _MAX: Final[int] = -9
+    HIGH: Final[int] = -2
+    DEFAULT: Final[int] = 0
+    LOW: Final[int] = 2
+    _MIN: Final[int] = 9
 
+
+@dataclass(kw_only=True, slots=True)
 class QosParams:
     """A container for QoS attributes and state."""
 
-    def __init__(
-        self,
-        *,
-        max_retries: int | None = DEFAULT_MAX_RETRIES,
-        timeout: float | None = DEFAULT_TIMEOUT,
-        wait_for_reply: bool | None = None,
-    ) -> None:
-        """Create a QosParams instance."""
-
-        self._max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
-        self._timeout = timeout or DEFAULT_TIMEOUT
-        self._wait_for_reply = wait_for_reply  # False / None have different meanings
-
-        self._echo_pkt: Packet | None = None
-        self._rply_pkt: Packet | None = None
-
-        self._dt_cmd_sent: dt | None = None
-        self._dt_echo_rcvd: dt | None = None
-        self._dt_rply_rcvd: dt | None = None
+    # declared non-Optional: None is accepted only as an input sentinel & is
+    # replaced by the default in __post_init__
+    max_retries: int = DEFAULT_MAX_RETRIES
+    timeout: float = DEFAULT_TIMEOUT
+    wait_for_reply: bool | None = None  # False / None have different meanings
 
-    @property
-    def max_retries(self) -> int:
-        return self._max_retries
+    _echo_pkt: Packet | None = field(default=None, init=False)
+    _rply_pkt: Packet | None = field(default=None, init=False)
 
-    @property
-    def timeout(self) -> float:
-        return self._timeout
+    _dt_cmd_sent: dt | None = field(default=None, init=False)
+    _dt_echo_rcvd: dt | None = field(default=None, init=False)
+    _dt_rply_rcvd: dt | None = field(default=None, init=False)
 
-    @property
-    def wait_for_reply(self) -> bool | None:
-        # None has a special meaning, distinct from False
-        return self._wait_for_reply
+    def __post_init__(self) -> None:
+        if self.max_retries is None:
+            self.max_retries = DEFAULT_MAX_RETRIES
+        self.timeout = self.timeout or DEFAULT_TIMEOUT
 
 
+@dataclass(kw_only=True, slots=True)
 class SendParams:
     """A container for Send attributes and state."""
 
-    def __init__(
-        self,
-        *,
-        gap_duration: float | None = _DEFAULT_TX_DELAY,
-        num_repeats: int | None = _DEFAULT_TX_COUNT,
-        priority: SendPriority | None = SendPriority.DEFAULT,
-    ) -> None:
-        """Create a SendParams instance."""
-
-        self._gap_duration = gap_duration or _DEFAULT_TX_DELAY
-        self._num_repeats = num_repeats or _DEFAULT_TX_COUNT
-        self._priority = priority or SendPriority.DEFAULT
-
-        self._dt_cmd_arrived: dt | None = None
-        self._dt_cmd_queued: dt | None = None
-        self._dt_cmd_sent: dt | None = None
-
-    @property
-    def gap_duration(self) -> float:
-        return self._gap_duration
+    # declared non-Optional: None is accepted only as an input sentinel & is
+    # replaced by the default in __post_init__
+    gap_duration: float = _DEFAULT_TX_DELAY
+    num_repeats: int = _DEFAULT_TX_COUNT
+    priority: int = SendPriority.DEFAULT
 
-    @property
-    def num_repeats(self) -> int:
-        return self._num_repeats
+    _dt_cmd_arrived: dt | None = field(default=None, init=False)
+    _dt_cmd_queued: dt | None = field(default=None, init=False)
+    _dt_cmd_sent: dt | None = field(default=None, init=False)
 
-    @property
-    def priority(self) -> SendPriority:
-        return self._priority
+    def __post_init__(self) -> None:
+        self.gap_duration = self.gap_duration or _DEFAULT_TX_DELAY
+        self.num_repeats = self.num_repeats or _DEFAULT_TX_COUNT
+        if self.priority is None:
+            self.priority = SendPriority.DEFAULT
 
 
 class RamsesTransportT(Protocol):
@@ -173,7 +149,7 @@ class RamsesProtocolT(Protocol):
         *,
         gap_duration: float = _DEFAULT_TX_DELAY,
         num_repeats: int = _DEFAULT_TX_COUNT,
-        priority: SendPriority = SendPriority.DEFAULT,
+        priority: int = SendPriority.DEFAULT,
         qos: QosParams | None = None,
     ) -> Packet | None:
         ...
@@ -113,9 +113,9 @@ async def test_hvac_bind_rem(test_port):
 
     dtm = dt.now() + td(seconds=5)
     while dtm > dt.now():
-        await asyncio.sleep(0.002)
         if flow_marker == BIND_COMPLETED:
             break
+        await asyncio.sleep(0.002)  # check first: no sleep when already completed
 
     await gwy.stop()
     assert flow_marker == BIND_COMPLETED
@@ -160,9 +160,9 @@ async def test_hvac_bind_co2(test_port):
 
     dtm = dt.now() + td(seconds=5)
     while dtm > dt.now():
-        await asyncio.sleep(0.002)
         if flow_marker == BIND_COMPLETED:
             break
+        await asyncio.sleep(0.002)  # check first: no sleep when already completed
 
     await gwy.stop()
     assert flow_marker == BIND_COMPLETED
@@ -6,9 +6,12 @@
 Test CH/DHW schedules with a mocked controller.
 """
 
-from copy import deepcopy
+from contextvars import ContextVar
+from functools import lru_cache
 from unittest.mock import patch
 
+import pytest
+
 from tests_deprecated.common import (
     TEST_DIR,
     abort_if_rf_test_fails,
@@ -39,8 +42,52 @@ def pytest_generate_tests(metafunc):
     metafunc.parametrize("test_port", test_ports.items(), ids=test_ports.keys())
 
 
-# NOTE: used as a global
-_global_flow_marker: int = None  # type: ignore[assignment]
+# one started gateway per port for the whole module: loading the config file and
+# starting the (mock) gateway dominates the per-test cost
+_gwy_cache: dict = {}
+_gwy_clients: dict = {}
+
+
+async def _get_test_gwy(test_port) -> "Gateway":
+    """Return the module's shared gateway for this port (see make_flow_tracker)."""
+
+    key = test_port[0]
+    gwy = _gwy_cache.get(key)
+    if gwy is None:
+        gwy = _gwy_cache[key] = await load_test_gwy(
+            *test_port, f"{WORK_DIR}/{CONFIG_FILE}"
+        )
+        gwy.create_client(lambda msg, *args, **kwargs: _gwy_clients[key](msg))
+
+    _gwy_clients[key] = lambda msg: None  # until the test installs its tracker
+    gwy._disable_sending = False  # may have been set by a previous test
+    return gwy
+
+
+def install_flow_tracker(test_port, tcs_id, zone_idx=None) -> None:
+    """Install a msg handler that asserts the schedule packet flow for one zone."""
+
+    tables = _flow_hdr_tables(tcs_id, zone_idx)  # resolved once, not per-packet
+
+    def track_packet_flow_wrapper(msg: Message, *args, **kwargs):
+        track_packet_flow(msg, tables)
+
+    _gwy_clients[test_port[0]] = track_packet_flow_wrapper
+
+
+@pytest.fixture(autouse=True, scope="module")
+async def _stop_test_gwys():
+    try:
+        yield
+    finally:
+        for gwy in _gwy_cache.values():
+            await gwy.stop()
+        _gwy_cache.clear()
+        _gwy_clients.clear()
+
+
+# NOTE: a ContextVar, not a global: tests stay independent when run concurrently
+_flow_marker: ContextVar[int] = ContextVar("flow_marker", default=None)  # type: ignore[arg-type]
 
 
 MIN_GAP_BETWEEN_WRITES = 0  # patch ramses_tx.transport
@@ -64,74 +111,109 @@ I__0404_OTHER_EXPECTED = 66
 I__0404_FINAL_RECEIVED = 69
 
 
-def track_packet_flow(msg, tcs_id, zone_idx=None):
+# kinds of flow-relevant headers (values for the lookup tables, below)
+_RQ_0006, _RP_0006 = 0, 1
+_RQ_0404_FIRST, _RP_0404_FIRST = 2, 3
+_RQ_0404_OTHER, _RP_0404_OTHER = 4, 5
+_W__0404_FIRST, _I__0404_FIRST = 6, 7
+_W__0404_OTHER, _I__0404_OTHER = 8, 9
+
+
+@lru_cache(maxsize=None)
+def _flow_hdr_tables(tcs_id, zone_idx=None) -> tuple[dict, tuple]:
+    """Build (once per TCS/zone pair) the expected-header lookup tables."""
+
+    exact = {
+        f"0006|RQ|{tcs_id}": _RQ_0006,
+        f"0006|RP|{tcs_id}": _RP_0006,
+        f"0404|RQ|{tcs_id}|{zone_idx}01": _RQ_0404_FIRST,
+        f"0404|RP|{tcs_id}|{zone_idx}01": _RP_0404_FIRST,
+        f"0404| W|{tcs_id}|{zone_idx}01": _W__0404_FIRST,
+        f"0404| I|{tcs_id}|{zone_idx}01": _I__0404_FIRST,
+    }
+    prefix = (
+        (f"0404|RQ|{tcs_id}|{zone_idx}", _RQ_0404_OTHER),
+        (f"0404|RP|{tcs_id}|{zone_idx}", _RP_0404_OTHER),
+        (f"0404| W|{tcs_id}|{zone_idx}", _W__0404_OTHER),
+        (f"0404| I|{tcs_id}|{zone_idx}", _I__0404_OTHER),
+    )
+    return exact, prefix
+
+
+def track_packet_flow(msg, tables):
     """Test the flow of packets (messages)."""
 
-    global _global_flow_marker
-
     if msg.code not in (Code._0006, Code._0404):
         return
 
+    # one dict probe (falling back to four prefix tests) per packet, instead of
+    # rebuilding up to eight f-strings per packet
+    exact, prefix = tables
+
+    hdr = msg._pkt._hdr
+    if (kind := exact.get(hdr)) is None:
+        kind = next((k for p, k in prefix if hdr.startswith(p)), None)
+
     # get the schedule version number
-    if msg._pkt._hdr == f"0006|RQ|{tcs_id}":
-        assert _global_flow_marker == RQ_0006_EXPECTED
-        _global_flow_marker = RP_0006_EXPECTED
+    if kind == _RQ_0006:
+        assert _flow_marker.get() == RQ_0006_EXPECTED
+        _flow_marker.set(RP_0006_EXPECTED)
 
-    elif msg._pkt._hdr == f"0006|RP|{tcs_id}":
-        assert _global_flow_marker == RP_0006_EXPECTED
-        _global_flow_marker = RP_0006_RECEIVED  # RQ_0404_FIRST_EXPECTED
+    elif kind == _RP_0006:
+        assert _flow_marker.get() == RP_0006_EXPECTED
+        _flow_marker.set(RP_0006_RECEIVED)  # RQ_0404_FIRST_EXPECTED
 
     # get the first schedule fragment, is possibly the last fragment too
-    elif msg._pkt._hdr == f"0404|RQ|{tcs_id}|{zone_idx}01":
-        assert _global_flow_marker in (RQ_0404_FIRST_EXPECTED, RP_0006_RECEIVED)
-        _global_flow_marker = RP_0404_FIRST_EXPECTED
+    elif kind == _RQ_0404_FIRST:
+        assert _flow_marker.get() in (RQ_0404_FIRST_EXPECTED, RP_0006_RECEIVED)
+        _flow_marker.set(RP_0404_FIRST_EXPECTED)
 
-    elif msg._pkt._hdr == f"0404|RP|{tcs_id}|{zone_idx}01":
-        assert _global_flow_marker == RP_0404_FIRST_EXPECTED
+    elif kind == _RP_0404_FIRST:
+        assert _flow_marker.get() == RP_0404_FIRST_EXPECTED
         if msg.payload["frag_number"] < msg.payload["total_frags"]:
-            _global_flow_marker = RQ_0404_OTHER_EXPECTED
+            _flow_marker.set(RQ_0404_OTHER_EXPECTED)
         else:
-            _global_flow_marker = RP_0404_FINAL_RECEIVED
+            _flow_marker.set(RP_0404_FINAL_RECEIVED)
 
     # get the subsequent schedule fragments, until the last fragment
-    elif msg._pkt._hdr[:20] == f"0404|RQ|{tcs_id}|{zone_idx}":
-        assert _global_flow_marker == RQ_0404_OTHER_EXPECTED
-        _global_flow_marker = RP_0404_OTHER_EXPECTED
+    elif kind == _RQ_0404_OTHER:
+        assert _flow_marker.get() == RQ_0404_OTHER_EXPECTED
+        _flow_marker.set(RP_0404_OTHER_EXPECTED)
 
-    elif msg._pkt._hdr[:20] == f"0404|RP|{tcs_id}|{zone_idx}":
-        assert _global_flow_marker == RP_0404_OTHER_EXPECTED
+    elif kind == _RP_0404_OTHER:
+        assert _flow_marker.get() == RP_0404_OTHER_EXPECTED
         if msg.payload["frag_number"] < msg.payload["total_frags"]:
-            _global_flow_marker = RQ_0404_OTHER_EXPECTED
+            _flow_marker.set(RQ_0404_OTHER_EXPECTED)
         else:
-            _global_flow_marker = RP_0404_FINAL_RECEIVED
+            _flow_marker.set(RP_0404_FINAL_RECEIVED)
 
     # set the first schedule fragment, is possibly the last fragment too
-    elif msg._pkt._hdr == f"0404| W|{tcs_id}|{zone_idx}01":
-        assert _global_flow_marker in (
+    elif kind == _W__0404_FIRST:
+        assert _flow_marker.get() in (
             W__0404_FIRST_EXPECTED,
             RP_0006_RECEIVED,
             RP_0404_FINAL_RECEIVED,
         )
-        _global_flow_marker = I__0404_FIRST_EXPECTED
+        _flow_marker.set(I__0404_FIRST_EXPECTED)
 
-    elif msg._pkt._hdr == f"0404| I|{tcs_id}|{zone_idx}01":
-        assert _global_flow_marker == I__0404_FIRST_EXPECTED
+    elif kind == _I__0404_FIRST:
+        assert _flow_marker.get() == I__0404_FIRST_EXPECTED
         if msg.payload["frag_number"] < msg.payload["total_frags"]:
-            _global_flow_marker = W__0404_OTHER_EXPECTED
+            _flow_marker.set(W__0404_OTHER_EXPECTED)
         else:
-            _global_flow_marker = I__0404_FINAL_RECEIVED
+            _flow_marker.set(I__0404_FINAL_RECEIVED)
 
     # set the subsequent schedule fragments, until the last fragment
-    elif msg._pkt._hdr[:20] == f"0404| W|{tcs_id}|{zone_idx}":
-        assert _global_flow_marker == W__0404_OTHER_EXPECTED
-        _global_flow_marker = I__0404_OTHER_EXPECTED
+    elif kind == _W__0404_OTHER:
+        assert _flow_marker.get() == W__0404_OTHER_EXPECTED
+        _flow_marker.set(I__0404_OTHER_EXPECTED)
 
-    elif msg._pkt._hdr[:20] == f"0404| I|{tcs_id}|{zone_idx}":
-        assert _global_flow_marker == I__0404_OTHER_EXPECTED
+    elif kind == _I__0404_OTHER:
+        assert _flow_marker.get() == I__0404_OTHER_EXPECTED
         if msg.payload["frag_number"] < msg.payload["total_frags"]:
-            _global_flow_marker = W__0404_OTHER_EXPECTED
+            _flow_marker.set(W__0404_OTHER_EXPECTED)
         else:
-            _global_flow_marker = I__0404_FINAL_RECEIVED
+            _flow_marker.set(I__0404_FINAL_RECEIVED)
 
     else:
         assert False, msg
@@ -173,11 +255,9 @@ async def read_schedule(zone: DhwZone | Zone) -> list:  # uses: flow_marker
     # [{  'day_of_week': 0,
     #     'switchpoints': [{'time_of_day': '06:30', 'heat_setpoint': 21.0}, ...], }]
 
-    global _global_flow_marker
-
-    _global_flow_marker = RQ_0006_EXPECTED
+    _flow_marker.set(RQ_0006_EXPECTED)
     schedule = await zone.get_schedule()  # RQ|0404, may: TimeoutError
-    assert _global_flow_marker == RP_0404_FINAL_RECEIVED
+    assert _flow_marker.get() == RP_0404_FINAL_RECEIVED
 
     if not schedule:  # valid test?
         assert zone._msgs[Code._0404].payload[SZ_TOTAL_FRAGS] is None
@@ -187,9 +267,9 @@ async def read_schedule(zone: DhwZone | Zone) -> list:  # uses: flow_marker
 
     zone._gwy._disable_sending = True
 
-    _global_flow_marker = RQ_0006_EXPECTED
+    _flow_marker.set(RQ_0006_EXPECTED)
     assert schedule == await zone.get_schedule(force_io=False)
-    assert _global_flow_marker == RQ_0006_EXPECTED
+    assert _flow_marker.get() == RQ_0006_EXPECTED
 
     try:
         await zone.get_schedule(force_io=True)
@@ -204,27 +284,25 @@ async def read_schedule(zone: DhwZone | Zone) -> list:  # uses: flow_marker
 async def read_schedule_ver(tcs: System) -> list:  # uses: flow_marker
     """Test the get_schedule() method for a Zone or for DHW."""
 
-    global _global_flow_marker
-
-    _global_flow_marker = RQ_0006_EXPECTED
+    _flow_marker.set(RQ_0006_EXPECTED)
     ver = (await tcs._schedule_version())[0]  # RQ|0006, may: TimeoutError
-    assert _global_flow_marker == RP_0006_RECEIVED
+    assert _flow_marker.get() == RP_0006_RECEIVED
 
     assert isinstance(ver, int)
     assert ver == tcs._msgs[Code._0006].payload["change_counter"]
 
-    _global_flow_marker = RQ_0006_EXPECTED  # actually, is not expected
+    _flow_marker.set(RQ_0006_EXPECTED)  # actually, is not expected
     assert ver == (await tcs._schedule_version(force_io=False))[0]
-    assert _global_flow_marker == RQ_0006_EXPECTED
+    assert _flow_marker.get() == RQ_0006_EXPECTED
 
     ver = (await tcs._schedule_version(force_io=True))[0]  # RQ|0006, may: TimeoutError
-    assert _global_flow_marker == RP_0006_RECEIVED
+    assert _flow_marker.get() == RP_0006_RECEIVED
 
     tcs._gwy._disable_sending = True  # TODO: must speak directly to lower layer?
 
-    _global_flow_marker = RQ_0006_EXPECTED  # actually, is not expected
+    _flow_marker.set(RQ_0006_EXPECTED)  # actually, is not expected
     ver = (await tcs._schedule_version())[0]  # RQ|0006, may: TimeoutError
-    assert _global_flow_marker == RQ_0006_EXPECTED
+    assert _flow_marker.get() == RQ_0006_EXPECTED
 
     try:
         await tcs._schedule_version(force_io=True)
@@ -240,16 +318,19 @@ async def write_schedule(zone: DhwZone | Zone) -> None:  # uses: flow_marker
     # FYI: [{  'day_of_week': 0,
     #     'switchpoints': [{'time_of_day': '06:30', 'heat_setpoint': 21.0}, ...], }]
 
-    global _global_flow_marker
-
-    _global_flow_marker = RQ_0006_EXPECTED  # because of force_io=True
+    _flow_marker.set(RQ_0006_EXPECTED)  # because of force_io=True
     ver_old, _ = await zone.tcs._schedule_version(force_io=True)
-    assert _global_flow_marker == RP_0006_RECEIVED
+    assert _flow_marker.get() == RP_0006_RECEIVED
 
     sch_old = await zone.get_schedule()
-    assert _global_flow_marker == RP_0404_FINAL_RECEIVED
+    assert _flow_marker.get() == RP_0404_FINAL_RECEIVED
 
-    sch_new = deepcopy(sch_old)
+    # clone only the path that may be mutated below: deepcopy walked the whole
+    # schedule graph (7 days x ~6 switchpoints) to change a single leaf
+    sch_new = list(sch_old)
+    sch_new[0] = dict(sch_old[0])
+    sch_new[0][SWITCHPOINTS] = list(sch_old[0][SWITCHPOINTS])
+    sch_new[0][SWITCHPOINTS][0] = dict(sch_old[0][SWITCHPOINTS][0])
 
     # if zone._gwy.pkt_transport.serial.port == MOCKED_PORT:
     #     # change the schedule (doesn't matter to what)
@@ -263,20 +344,20 @@ async def write_schedule(zone: DhwZone | Zone) -> None:  # uses: flow_marker
     #         ) % 30 + 5
 
     _ = await zone.set_schedule(sch_new)  # check zone._schedule._schedule
-    assert _global_flow_marker == I__0404_FINAL_RECEIVED
+    assert _flow_marker.get() == I__0404_FINAL_RECEIVED
 
-    _global_flow_marker = RQ_0006_EXPECTED  # because of force_io=True
+    _flow_marker.set(RQ_0006_EXPECTED)  # because of force_io=True
     ver_tst, _ = await zone.tcs._schedule_version(force_io=True)  # TODO: force_io=False
-    assert _global_flow_marker == RP_0006_RECEIVED
+    assert _flow_marker.get() == RP_0006_RECEIVED
 
     assert ver_tst > ver_old
 
-    _global_flow_marker = RQ_0006_EXPECTED
+    _flow_marker.set(RQ_0006_EXPECTED)
     sch_tst = await zone.get_schedule()  # will use latest I/RP|0006
-    assert _global_flow_marker == RQ_0006_EXPECTED
+    assert _flow_marker.get() == RQ_0006_EXPECTED
 
     sch_tst = await zone.get_schedule(force_io=True)  # will force RQ|0006
-    assert _global_flow_marker == RP_0006_RECEIVED
+    assert _flow_marker.get() == RP_0006_RECEIVED
 
     assert sch_tst == sch_new
     # if zone._gwy.pkt_transport.serial.port == MOCKED_PORT:
@@ -289,18 +370,12 @@ async def write_schedule(zone: DhwZone | Zone) -> None:  # uses: flow_marker
 async def test_rq_0006_ver(test_port):
     """Test the TCS._schedule_version() method."""
 
-    def track_packet_flow_wrapper(msg: Message, *args, **kwargs):
-        track_packet_flow(msg, tcs.id)
-
-    gwy = await load_test_gwy(*test_port, f"{WORK_DIR}/{CONFIG_FILE}")
-    gwy.create_client(track_packet_flow_wrapper)
+    gwy = await _get_test_gwy(test_port)
 
     tcs: System = find_test_tcs(gwy)
+    install_flow_tracker(test_port, tcs.id)
 
-    try:
-        await read_schedule_ver(tcs)
-    finally:
-        await gwy.stop()
+    await read_schedule_ver(tcs)
 
 
 @abort_if_rf_test_fails
@@ -308,20 +383,14 @@ async def test_rq_0006_ver(test_port):
 async def test_rq_0404_dhw(test_port):
     """Test the dhw.get_schedule() method."""
 
-    def track_packet_flow_wrapper(msg: Message, *args, **kwargs):
-        track_packet_flow(msg, tcs.id, dhw.idx)
-
-    gwy = await load_test_gwy(*test_port, f"{WORK_DIR}/{CONFIG_FILE}")
-    gwy.create_client(track_packet_flow_wrapper)
+    gwy = await _get_test_gwy(test_port)
 
     tcs: System = find_test_tcs(gwy)
     dhw: DhwZone = tcs.dhw
+    install_flow_tracker(test_port, tcs.id, dhw.idx if dhw else None)
 
-    try:
-        if dhw or test_port[0] == MOCKED_PORT:  # mocked port should have DHW
-            await read_schedule(dhw)
-    finally:
-        await gwy.stop()
+    if dhw or test_port[0] == MOCKED_PORT:  # mocked port should have DHW
+        await read_schedule(dhw)
 
 
 @abort_if_rf_test_fails
@@ -329,20 +398,14 @@ async def test_rq_0404_dhw(test_port):
 async def test_rq_0404_zon(test_port):
     """Test the zone.get_schedule() method."""
 
-    def track_packet_flow_wrapper(msg: Message, *args, **kwargs):
-        track_packet_flow(msg, tcs.id, zon.idx)
-
-    gwy = await load_test_gwy(*test_port, f"{WORK_DIR}/{CONFIG_FILE}")
-    gwy.create_client(track_packet_flow_wrapper)
+    gwy = await _get_test_gwy(test_port)
 
     tcs: System = find_test_tcs(gwy)
     zon: Zone = tcs.zones[0]
+    install_flow_tracker(test_port, tcs.id, zon.idx)
 
-    try:
-        # if zon:
-        await read_schedule(zon)
-    finally:
-        await gwy.stop()
+    # if zon:
+    await read_schedule(zon)
 
 
 @abort_if_rf_test_fails
@@ -350,20 +413,14 @@ async def test_rq_0404_zon(test_port):
 async def test_ww_0404_dhw(test_port):
     """Test the dhw.set_schedule() method (uses get_schedule)."""
 
-    def track_packet_flow_wrapper(msg: Message, *args, **kwargs):
-        track_packet_flow(msg, tcs.id, dhw.idx)
-
-    gwy = await load_test_gwy(*test_port, f"{WORK_DIR}/{CONFIG_FILE}")
-    gwy.create_client(track_packet_flow_wrapper)
+    gwy = await _get_test_gwy(test_port)
 
     tcs: System = find_test_tcs(gwy)
     dhw: DhwZone = tcs.dhw
+    install_flow_tracker(test_port, tcs.id, dhw.idx if dhw else None)
 
-    try:
-        if dhw or test_port[0] == MOCKED_PORT:  # mocked port should have DHW
-            await write_schedule(dhw)
-    finally:
-        await gwy.stop()
+    if dhw or test_port[0] == MOCKED_PORT:  # mocked port should have DHW
+        await write_schedule(dhw)
 
 
 @abort_if_rf_test_fails
@@ -371,17 +428,11 @@ async def test_ww_0404_dhw(test_port):
 async def test_ww_0404_zon(test_port):
     """Test the zone.set_schedule() method (uses get_schedule)."""
 
-    def track_packet_flow_wrapper(msg: Message, *args, **kwargs):
-        track_packet_flow(msg, tcs.id, zon.idx)
-
-    gwy = await load_test_gwy(*test_port, f"{WORK_DIR}/{CONFIG_FILE}")
-    gwy.create_client(track_packet_flow_wrapper)
+    gwy = await _get_test_gwy(test_port)
 
     tcs: System = find_test_tcs(gwy)
     zon: Zone = tcs.zones[0]
+    install_flow_tracker(test_port, tcs.id, zon.idx)
 
-    try:
-        # if zon:
-        await write_schedule(zon)
-    finally:
-        await gwy.stop()
+    # if zon:
+    await write_schedule(zon)
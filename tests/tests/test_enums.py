@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+"""RAMSES RF - a RAMSES-II protocol decoder & analyser.
+
+Test the enums (member-value uniqueness is asserted here, rather than with
+@verify(EnumCheck.UNIQUE), which would re-walk every value set at import).
+"""
+
+from enum import Enum
+
+import pytest
+
+from ramses_tx.const import Code, DevRole, DevType
+from ramses_tx.opentherm import MsgId, OtMsgType, Sensor
+
+ENUMS = (Code, DevRole, DevType, MsgId, OtMsgType, Sensor)
+
+
+@pytest.mark.parametrize("enum", ENUMS, ids=(e.__name__ for e in ENUMS))
+def test_enum_member_values_are_unique(enum: type[Enum]) -> None:
+    assert len({m.value for m in enum}) == len(enum)
@@ -10,7 +10,7 @@ Test the various helper APIs.
 
 from ramses_rf.const import DEV_ROLE_MAP, DEV_TYPE_MAP
 from ramses_rf.helpers import merge
-from ramses_tx.const import attr_dict_factory
+from ramses_tx.const import DEVICE_ID_REGEX, attr_dict_factory, classify_device_id
 from tests.helpers import assert_raises
 
 
@@ -42,6 +42,21 @@ def test_merge_dicts() -> None:
     assert out == merge(src, dst)
 
 
+def test_classify_device_id() -> None:
+    """Check the prefix table agrees with DEVICE_ID_REGEX for every type prefix."""
+
+    for prefix in range(100):
+        device_id = f"{prefix:02d}:123456"
+        klasses = classify_device_id(device_id)
+        for klass in ("BDR", "CTL", "DHW", "HGI", "APP", "UFC", "SEN"):
+            assert (klass in klasses) == bool(
+                getattr(DEVICE_ID_REGEX, klass).match(device_id)
+            ), device_id
+
+    assert classify_device_id("XX:123456") == frozenset()  # not a device ID
+    assert classify_device_id("01:23456") == frozenset()  # too short
+
+
 def test_attrdict_class() -> None:
     _ = attr_dict_factory(MAIN_DICT, attr_table=ATTR_DICT)
 
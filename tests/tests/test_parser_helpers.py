@@ -25,11 +25,18 @@ from ramses_tx.helpers import (
     # hex_to_str,
     hex_to_temp,
 )
+from ramses_tx.message import Message
 from ramses_tx.packet import Packet
 from tests.helpers import TEST_DIR
 
 WORK_DIR = f"{TEST_DIR}/parser_helpers"
 
+MSG_BATCH_LOG_LINES = (
+    "2022-01-01T00:00:00.000000 000  I --- 01:145038 --:------ 01:145038 1F09 003 FF04B5",
+    "2022-01-01T00:00:01.000000 000  I --- 13:123456 --:------ 13:123456 0001 003 010000",  # bad idx
+    "2022-01-01T00:00:02.000000 000  I --- 04:262143 --:------ 04:262143 30C9 003 000713",
+)
+
 
 def test_helper_demand_transform() -> None:
     assert [x[1] for x in TRANSFORMS] == [_transform(x[0]) for x in TRANSFORMS]
@@ -92,6 +99,16 @@ def _test_pkt_dev_class() -> None:  # noqa: F811
                 proc_log_line(line)
 
 
+def test_msg_from_packets() -> None:
+    """Check that a batch of packets is decoded, dropping the invalid ones."""
+
+    pkts = [Packet.from_file(x[:26], x[27:]) for x in MSG_BATCH_LOG_LINES]
+    msgs = Message.from_packets(pkts)
+
+    assert [m.code for m in msgs] == ["1F09", "30C9"]  # the bad-idx pkt is dropped
+    assert all(m._pkt is p for m, p in zip(msgs, (pkts[0], pkts[2]), strict=True))
+
+
 def test_pkt_addr_sets() -> None:  # noqa: F811
     """Check that the address set is correctly inferred from the packet."""
 
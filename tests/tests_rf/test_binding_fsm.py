@@ -17,7 +17,7 @@ from unittest.mock import patch
 
 import pytest
 
-from ramses_rf import Code, Device, Gateway, Message, Packet
+from ramses_rf import Code, Device, Message, Packet
 from ramses_rf.binding_fsm import (
     SZ_RESPONDENT,
     SZ_SUPPLICANT,
@@ -166,15 +166,50 @@ TEST_SUITE_300 = [
 # ### FIXTURES #########################################################################
 
 
-@pytest.fixture(autouse=True)
-def patches_for_tests(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setattr(
-        "ramses_tx.protocol._DEBUG_DISABLE_IMPERSONATION_ALERTS",
-        _DEBUG_DISABLE_IMPERSONATION_ALERTS,
-    )
-    monkeypatch.setattr(
-        "ramses_tx.protocol.MIN_GAP_BETWEEN_WRITES", MIN_GAP_BETWEEN_WRITES
+@pytest.fixture(autouse=True, scope="module")  # module: outlives the shared RF below
+def patches_for_tests():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            "ramses_tx.protocol._DEBUG_DISABLE_IMPERSONATION_ALERTS",
+            _DEBUG_DISABLE_IMPERSONATION_ALERTS,
+        )
+        monkeypatch.setattr(
+            "ramses_tx.protocol.MIN_GAP_BETWEEN_WRITES", MIN_GAP_BETWEEN_WRITES
+        )
+        yield
+
+
+def _union_config(role: str) -> dict:
+    """Return a gwy config covering that role's devices from every test case."""
+
+    known_list = {
+        k: v
+        for t in TEST_SUITE_300
+        for d in (t[SZ_RESPONDENT], t[SZ_SUPPLICANT])
+        for k, v in d.items()
+    }
+    orphans = list(dict.fromkeys(k for t in TEST_SUITE_300 for k in t[role]))
+    return GWY_CONFIG | {"known_list": known_list, "orphans_hvac": orphans}
+
+
+@pytest.fixture(scope="module")
+async def binding_rf(patches_for_tests):
+    """One virtual RF and Gateway pair, shared by every binding test case.
+
+    Restarting the pty pair and both gateways per case dominated the suite's
+    runtime; the cases use disjoint (or reset) binding contexts, so they can
+    share one network.
+    """
+
+    rf, gwys = await rf_factory(
+        [_union_config(SZ_RESPONDENT), _union_config(SZ_SUPPLICANT)]
     )
+    try:
+        yield gwys
+    finally:
+        for gwy in gwys:
+            await gwy.stop()
+        await rf.stop()
 
 
 def pytest_generate_tests(metafunc: pytest.Metafunc):
@@ -208,11 +243,18 @@ def ensure_fakeable(dev: Device) -> None:
 async def assert_context_state(
     device: Fakeable, state: type[BindStateBase], max_sleep: int = DEFAULT_MAX_SLEEP
 ) -> None:
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if isinstance(device._context.state, state):
+    # edge-triggered: wait on the context's transition event, not a polling sleep
+    ctx = device._context
+    deadline = ctx._loop.time() + max_sleep
+    while not isinstance(ctx.state, state):
+        ctx._state_event.clear()
+        if (timeout := deadline - ctx._loop.time()) <= 0:
+            break
+        try:
+            await asyncio.wait_for(ctx._state_event.wait(), timeout=timeout)
+        except TimeoutError:
             break
-    assert isinstance(device._context.state, state)
+    assert isinstance(ctx.state, state)
 
 
 # ### TESTS ############################################################################
@@ -220,19 +262,20 @@ async def assert_context_state(
 
 # TODO: test addenda phase of binding handshake
 async def _test_flow_10x(
-    gwy_r: Gateway, gwy_s: Gateway, pkt_flow_expected: list[str]
+    respondent: Fakeable, supplicant: Fakeable, pkt_flow_expected: list[str]
 ) -> None:
     """Check the change of state during a binding at device layer."""
 
     # STEP 0: Setup...
     loop = asyncio.get_running_loop()
 
-    respondent: Fakeable = gwy_r.devices[0]
-    supplicant: Fakeable = gwy_s.devices[0]
     ensure_fakeable(respondent)
+    if not isinstance(respondent._context.state, _BindStates.IS_IDLE_DEVICE):
+        respondent._context = BindContext(respondent)  # device re-used by earlier case
 
-    await assert_context_state(respondent, _BindStates.IS_IDLE_DEVICE)
-    await assert_context_state(supplicant, _BindStates.IS_IDLE_DEVICE)
+    async with asyncio.TaskGroup() as tg:  # the two contexts progress independently
+        tg.create_task(assert_context_state(respondent, _BindStates.IS_IDLE_DEVICE))
+        tg.create_task(assert_context_state(supplicant, _BindStates.IS_IDLE_DEVICE))
 
     assert not respondent._context.is_binding
     assert not supplicant._context.is_binding
@@ -264,7 +307,7 @@ async def _test_flow_10x(
     await resp_task
     await assert_context_state(respondent, _BindStates.NEEDING_AFFIRM)
 
-    if not isinstance(gwy_r._protocol, QosProtocol):
+    if not isinstance(respondent._gwy._protocol, QosProtocol):
         assert False, "QoS protocol not enabled"  # use assert, not skip
 
     tender = resp_task.result()
@@ -323,7 +366,7 @@ async def _test_flow_10x(
 
     # Step S3: Supplicant sends an Addenda (optional)
     msg = Message(Packet(dt.now(), "000 " + pkt_flow_expected[3]))
-    supplicant._msgz[msg.code] = {msg.verb: {msg._pkt._ctx: msg}}
+    supplicant._handle_msg(msg)  # use the store path, not a raw _msgz write
 
     pkt = await supplicant._context._cast_addenda()
     await assert_context_state(supplicant, _BindStates.HAS_BOUND_SUPP)
@@ -340,28 +383,17 @@ async def _test_flow_10x(
 # TODO: get test working without QoS
 @pytest.mark.xdist_group(name="virt_serial")
 @patch("ramses_tx.protocol._DEBUG_DISABLE_QOS", _DEBUG_DISABLE_QOS)
-async def test_flow_100(test_set: dict[str:dict]) -> None:
+async def test_flow_100(binding_rf, test_set: dict[str:dict]) -> None:
     """Check packet flow / state change of a binding at device layer."""
 
-    config = {}
-    for role in (SZ_RESPONDENT, SZ_SUPPLICANT):
-        devices = [d for d in test_set.values() if isinstance(d, dict)]
-        config[role] = GWY_CONFIG | {
-            "known_list": {k: v for d in devices for k, v in d.items()},
-            "orphans_hvac": list(test_set[role]),  # TODO: used by Heat domain too!
-        }
+    gwy_r, gwy_s = binding_rf  # the schema covers every test case's devices
 
     pkt_flow = [
         x[:46] + x[46:].replace(" ", "").replace("-", "")
         for x in test_set.get(PKT_FLOW, [])
     ]
 
-    # cant use fixture for this, as new schema required for every test
-    rf, gwys = await rf_factory([config[SZ_RESPONDENT], config[SZ_SUPPLICANT]])
+    respondent = gwy_r.device_by_id[list(test_set[SZ_RESPONDENT])[0]]
+    supplicant = gwy_s.device_by_id[list(test_set[SZ_SUPPLICANT])[0]]
 
-    try:
-        await _test_flow_10x(gwys[0], gwys[1], pkt_flow)
-    finally:
-        for gwy in gwys:
-            await gwy.stop()
-        await rf.stop()
+    await _test_flow_10x(respondent, supplicant, pkt_flow)
@@ -7,7 +7,7 @@
 
 """RAMSES RF - Check GWY address/type detection and its treatment of addr0."""
 
-import asyncio
+from functools import cache
 from unittest.mock import patch
 
 import pytest
@@ -60,10 +60,21 @@ TEST_CMDS = {  # test command strings (no impersonation)
 # NOTE: HGI80 will silently discard all frames that have addr0 != 18:000730
 TEST_CMDS_FAIL_ON_HGI80 = [k for k, v in TEST_CMDS.items() if v[7:16] == TST_ID_]
 
+# scan the serial ports once at import: comports() enumerates the USB tree, and the
+# result is used by both the skipif guards (at collection) and the real_* fixtures
+_EVOFW3_PORTS = [p.device for p in comports() if p.product and "evofw3" in p.product]
+_TI3410_PORTS = [p.device for p in comports() if p.product and "TUSB3410" in p.product]
+
 
 _global_failed_ports: list[str] = []
 
 
+@cache
+def _build_cmd(cmd_str: str) -> Command:
+    """Parse the command string once, and share the result across the fixtures."""
+    return Command(cmd_str, qos={"retries": 0})
+
+
 # ### FIXTURES #########################################################################
 
 
@@ -83,17 +94,9 @@ def patches_for_tests(monkeypatch: pytest.MonkeyPatch):
 
 
 def pytest_generate_tests(metafunc: pytest.Metafunc):
-    metafunc.parametrize("test_idx", TEST_CMDS)
-
-
-@pytest.fixture(scope="module")
-def event_loop():
-    """Overrides pytest default function scoped event loop"""
-    loop = asyncio.get_event_loop()
-    try:
-        yield loop
-    finally:
-        loop.close()
+    # parametrize on the command string itself (ids stay the TEST_CMDS keys): the
+    # tests then need no per-run TEST_CMDS[test_idx] lookup layer
+    metafunc.parametrize("org_str", TEST_CMDS.values(), ids=map(str, TEST_CMDS))
 
 
 @pytest.fixture(scope="module")
@@ -144,8 +147,7 @@ async def fake_ti3410():
 async def real_evofw3():
     """Utilize an actual evofw3-compatible gateway."""
 
-    port_names = [p.device for p in comports() if p.product and "evofw3" in p.product]
-    port_names = port_names or ["/dev/ttyUSB1"]  # HACK: FIXME (should not be needed)
+    port_names = _EVOFW3_PORTS or ["/dev/ttyUSB1"]  # HACK: FIXME (should not be needed)
 
     gwy = Gateway(port_names[0], **GWY_CONFIG)
     assert gwy.hgi is None and gwy.devices == []
@@ -164,8 +166,7 @@ async def real_evofw3():
 async def real_ti3410():
     """Utilize an actual HGI80-compatible gateway."""
 
-    port_names = [p.device for p in comports() if p.product and "TUSB3410" in p.product]
-    port_names = port_names or ["/dev/ttyUSB0"]  # HACK: FIXME (should not be needed)
+    port_names = _TI3410_PORTS or ["/dev/ttyUSB0"]  # HACK: FIXME (should not be needed)
 
     gwy = Gateway(port_names[0], **GWY_CONFIG)
     assert gwy.hgi is None and gwy.devices == []
@@ -188,17 +189,17 @@ async def real_ti3410():
     "ramses_tx.address._DEBUG_DISABLE_STRICT_CHECKING",
     _DEBUG_DISABLE_STRICT_CHECKING,
 )
-async def _test_gwy_device(gwy: Gateway, test_idx: str):
+async def _test_gwy_device(gwy: Gateway, org_str: str):
     """Check GWY address/type detection, and behaviour of its treatment of addr0."""
 
     if not isinstance(gwy._protocol, QosProtocol):
         assert False, "QoS protocol not enabled"  # use assert, not skip
 
     # we replace the (non-sentinel) gwy_id with the real gwy's actual dev_id
-    cmd_str = TEST_CMDS[test_idx].replace(TST_ID_, gwy.hgi.id)
+    cmd_str = org_str.replace(TST_ID_, gwy.hgi.id)
     # this is irrevelent for fake (virtual) gwys, as they been assigned this id
 
-    cmd = Command(cmd_str, qos={"retries": 0})
+    cmd = _build_cmd(cmd_str)
     assert str(cmd) == cmd_str  # sanity check
 
     is_hgi80 = not gwy._protocol._is_evofw3  # TODO: is_hgi80?
@@ -230,11 +231,8 @@ async def _test_gwy_device(gwy: Gateway, test_idx: str):
 
 
 @pytest.mark.xdist_group(name="real_serial")
-@pytest.mark.skipif(
-    not [p for p in comports() if p.product and "evofw3" in p.product],
-    reason="No evofw3 devices found",
-)
-async def test_real_evofw3(real_evofw3: Gateway, test_idx: str):
+@pytest.mark.skipif(not _EVOFW3_PORTS, reason="No evofw3 devices found")
+async def test_real_evofw3(real_evofw3: Gateway, org_str: str):
     """Validate the GWY test against a real (physical) evofw3."""
 
     global _global_failed_ports
@@ -245,18 +243,15 @@ async def test_real_evofw3(real_evofw3: Gateway, test_idx: str):
         pytest.skip(f"previous SerialException on: {gwy.ser_name}")
 
     try:
-        await _test_gwy_device(gwy, test_idx)
+        await _test_gwy_device(gwy, org_str)
     except SerialException as err:
         _global_failed_ports.append(gwy.ser_name)
         pytest.xfail(str(err))  # not skip, as we'd determined port exists, above
 
 
 @pytest.mark.xdist_group(name="real_serial")
-@pytest.mark.skipif(
-    not [p for p in comports() if p.product and "TUSB3410" in p.product],
-    reason="No ti3410 devices found",
-)
-async def test_real_ti3410(real_ti3410: Gateway, test_idx: str):
+@pytest.mark.skipif(not _TI3410_PORTS, reason="No ti3410 devices found")
+async def test_real_ti3410(real_ti3410: Gateway, org_str: str):
     """Validate the GWY test against a real (physical) HGI80."""
 
     global _global_failed_ports
@@ -267,21 +262,21 @@ async def test_real_ti3410(real_ti3410: Gateway, test_idx: str):
         pytest.skip(f"previous SerialException on: {gwy.ser_name}")
 
     try:
-        await _test_gwy_device(gwy, test_idx)
+        await _test_gwy_device(gwy, org_str)
     except SerialException as err:
         _global_failed_ports.append(gwy.ser_name)
         pytest.xfail(str(err))  # not skip, as we'd determined port exists, above
 
 
 @pytest.mark.xdist_group(name="virt_serial")
-async def test_fake_evofw3(fake_evofw3: Gateway, test_idx: str):
+async def test_fake_evofw3(fake_evofw3: Gateway, org_str: str):
     """Check the behaviour of the fake (virtual) evofw3 against the GWY test."""
 
-    await _test_gwy_device(fake_evofw3, test_idx)
+    await _test_gwy_device(fake_evofw3, org_str)
 
 
 @pytest.mark.xdist_group(name="virt_serial")
-async def test_fake_ti3410(fake_ti3410: Gateway, test_idx: str):
+async def test_fake_ti3410(fake_ti3410: Gateway, org_str: str):
     """Check the behaviour of the fake (virtual) HGI80 against the GWY test."""
 
-    await _test_gwy_device(fake_ti3410, test_idx)
+    await _test_gwy_device(fake_ti3410, org_str)
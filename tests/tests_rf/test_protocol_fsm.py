@@ -142,11 +142,18 @@ async def assert_protocol_state(
     expected_state: _ProtocolStateT,
     max_sleep: int = DEFAULT_MAX_SLEEP,
 ) -> None:
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if isinstance(protocol._context.state, expected_state):
+    # edge-triggered: wait on the context's transition event, not a polling sleep
+    ctx = protocol._context
+    deadline = ctx._loop.time() + max_sleep
+    while not isinstance(ctx.state, expected_state):
+        ctx._state_event.clear()
+        if (timeout := deadline - ctx._loop.time()) <= 0:
             break
-    assert isinstance(protocol._context.state, expected_state)
+        try:
+            await asyncio.wait_for(ctx._state_event.wait(), timeout=timeout)
+        except TimeoutError:
+            break
+    assert isinstance(ctx.state, expected_state)
 
 
 def assert_protocol_state_detail(
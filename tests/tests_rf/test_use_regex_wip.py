@@ -87,13 +87,30 @@ def patches_for_tests(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr("ramses_tx.protocol_fsm.DEFAULT_TIMEOUT", DEFAULT_TIMEOUT)
 
 
+def _msg_event(gwy: Gateway) -> asyncio.Event:
+    """Return an Event that is set whenever the gateway processes a Message."""
+
+    if (event := getattr(gwy, "_test_msg_event", None)) is None:
+        event = gwy._test_msg_event = asyncio.Event()
+        gwy.add_msg_handler(lambda msg: event.set())
+    return event
+
+
 async def assert_this_pkt(gwy, expected: Command, max_sleep: int = DEFAULT_MAX_SLEEP):
     """Check, at the gateway layer, that the current packet is as expected."""
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if gwy._this_msg and gwy._this_msg._pkt._frame == expected._frame:
-            break
-    assert gwy._this_msg and gwy._this_msg._pkt._frame == expected._frame
+
+    def predicate() -> bool:
+        return gwy._this_msg and gwy._this_msg._pkt._frame == expected._frame
+
+    event = _msg_event(gwy)
+    try:  # wake on each message, rather than polling on a timer
+        async with asyncio.timeout(max_sleep):
+            while not predicate():
+                await event.wait()
+                event.clear()
+    except TimeoutError:
+        pass
+    assert predicate()
 
 
 # ### TESTS ############################################################################
@@ -67,6 +67,27 @@ def patches_for_tests(monkeypatch: pytest.MonkeyPatch):
 # ######################################################################################
 
 
+def _msg_event(gwy: Gateway) -> asyncio.Event:
+    """Return an Event that is set whenever the gateway processes a Message."""
+
+    if (event := getattr(gwy, "_test_msg_event", None)) is None:
+        event = gwy._test_msg_event = asyncio.Event()
+        gwy.add_msg_handler(lambda msg: event.set())
+    return event
+
+
+async def _wait_for(predicate, event: asyncio.Event, max_sleep: float) -> None:
+    """Wait until the predicate holds, waking on the event (instead of polling)."""
+
+    try:
+        async with asyncio.timeout(max_sleep):
+            while not predicate():
+                await event.wait()
+                event.clear()
+    except TimeoutError:
+        pass  # the caller's assert will report the stale state
+
+
 async def assert_code_in_device_msgz(
     gwy: Gateway,
     dev_id: str,
@@ -76,13 +97,14 @@ async def assert_code_in_device_msgz(
 ):
     """Fail if the device doesn't exist, or if it doesn't have the code in its DB."""
 
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if ((dev := gwy.device_by_id.get(dev_id)) and (code in dev._msgz)) != test_not:
-            break
-    assert (
-        (dev := gwy.device_by_id.get(dev_id)) and (code in dev._msgz)
-    ) != test_not  # TODO: fix me
+    def predicate() -> bool:
+        return (
+            (dev := gwy.device_by_id.get(dev_id))
+            and any(c == code for c, _, _ in dev._msgz)
+        ) != test_not
+
+    await _wait_for(predicate, _msg_event(gwy), max_sleep)
+    assert predicate()  # TODO: fix me
 
 
 async def assert_devices(
@@ -90,20 +112,24 @@ async def assert_devices(
 ):
     """Fail if the two sets of devices are not equal."""
 
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if len(gwy.devices) == len(devices):
-            break
-    assert sorted(d.id for d in gwy.devices) == sorted(devices)
+    expected = set(devices)  # set compares are O(n): no per-check sort
+    await _wait_for(
+        lambda: {d.id for d in gwy.devices} == expected, _msg_event(gwy), max_sleep
+    )
+    assert {d.id for d in gwy.devices} == expected
 
 
-async def assert_this_pkt(transport, cmd: Command, max_sleep: int = DEFAULT_MAX_SLEEP):
+async def assert_this_pkt(
+    gwy: Gateway, cmd: Command, max_sleep: int = DEFAULT_MAX_SLEEP
+):
     """Check, at the transport layer, that the current packet is as expected."""
-    for _ in range(int(max_sleep / ASSERT_CYCLE_TIME)):
-        await asyncio.sleep(ASSERT_CYCLE_TIME)
-        if transport._this_pkt and transport._this_pkt._frame == cmd._frame:
-            break
-    assert transport._this_pkt and transport._this_pkt._frame == cmd._frame
+
+    def predicate() -> bool:
+        transport = gwy._transport
+        return transport._this_pkt and transport._this_pkt._frame == cmd._frame
+
+    await _wait_for(predicate, _msg_event(gwy), max_sleep)
+    assert predicate()
 
 
 # ### TESTS ############################################################################
@@ -195,8 +221,8 @@ async def test_virtual_rf_pkt_flow():
     await assert_devices(gwy_0, ["01:022222", "18:000000", "18:111111", "40:000000"])
     await assert_code_in_device_msgz(gwy_0, "01:022222", Code._1F09)
 
-    await assert_this_pkt(gwy_0._transport, cmd)
-    await assert_this_pkt(gwy_1._transport, cmd)
+    await assert_this_pkt(gwy_0, cmd)
+    await assert_this_pkt(gwy_1, cmd)
 
     # TEST 2:
     await assert_code_in_device_msgz(
@@ -210,8 +236,8 @@ async def test_virtual_rf_pkt_flow():
 
     # await assert_code_in_device_msgz(gwy_0, "40:000000", Code._22F1)  # ?needs QoS
 
-    await assert_this_pkt(gwy_0._transport, cmd)
-    await assert_this_pkt(gwy_1._transport, cmd)
+    await assert_this_pkt(gwy_0, cmd)
+    await assert_this_pkt(gwy_1, cmd)
 
     await assert_devices(gwy_0, ["01:022222", "18:000000", "18:111111", "40:000000"])
     await assert_devices(gwy_1, ["01:022222", "18:111111", "40:000000", "41:111111"])